@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+This file picks the fastest way to multiply on this machine. For each
+length and modulus 2^m it times the strategies of planner.py (Toom-n,
+natural or efficient, and Karatsuba, up to some depth) whose total loss
+fits in max_loss bits, and writes the winners to a wisdom file.
+multiply_auto then looks up the wisdom and multiplies with the winner.
+
+A strategy losing d bits is run mod 2^(m + d), so multiply_auto's answer
+is exact mod 2^m. max_loss caps d, for example to keep m + d within a
+machine word.
+
+Example:
+    python autotune.py --length 64 256 1024 --m 32 --max-loss 16
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import time
+
+import numpy as np
+
+import planner
+import precision_loser as pl
+
+DEFAULT_WISDOM = "toom_wisdom.json"
+DEFAULT_MAX_LOSS = 16
+
+# ========================================
+#
+#              Candidates
+#
+# ========================================
+def strategy_loss(strategy):
+    """ The bits lost by a strategy, the sum over its levels"""
+    return sum(planner.level_loss(level) for level in strategy)
+
+def admissible_strategies(N, max_loss, max_depth=2, ns=range(4, 16),
+                          formulas_list=("natural", "efficient"), limit=8):
+    """ The strategies worth timing for length N: schoolbook, and for each
+        depth the limit cheapest ones by planner.strategy_cost among those
+        losing at most max_loss bits"""
+    candidates = [strategy for strategy in planner.candidate_strategies(
+                      N, max_depth, ns, formulas_list)
+                  if strategy_loss(strategy) <= max_loss]
+    candidates.sort(key=lambda strategy: planner.strategy_cost(strategy, N))
+    chosen = [()]
+    for depth in range(1, max_depth + 1):
+        chosen.extend([strategy for strategy in candidates
+                       if len(strategy) == depth][:limit])
+    return chosen
+
+# ========================================
+#
+#               Timing
+#
+# ========================================
+def time_strategy(strategy, N, m, repeats=3, seed=0):
+    """ Returns the fastest of repeats runs of strategy on random polys of
+        length N, at the width it needs to be exact mod 2^m"""
+    width = m + strategy_loss(strategy)
+    rng = np.random.default_rng([seed, N, m])
+    f = pl.random_poly(N, width, rng)
+    g = pl.random_poly(N, width, rng)
+    # the first run also imports the kernels
+    pl.multiply_strategy(f, g, strategy, width)
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        pl.multiply_strategy(f, g, strategy, width)
+        seconds = time.perf_counter() - start
+        if best is None or seconds < best:
+            best = seconds
+    return best
+
+def tune_length(N, m, max_loss=DEFAULT_MAX_LOSS, max_depth=2, limit=8,
+                repeats=3, seed=0):
+    """ Times the admissible strategies for length N mod 2^m and returns
+        the wisdom entry of the fastest"""
+    timings = {}
+    for strategy in admissible_strategies(N, max_loss, max_depth, limit=limit):
+        timings[planner.format_strategy(strategy)] = time_strategy(
+            strategy, N, m, repeats, seed)
+    best = min(timings, key=timings.get)
+    strategy = planner.parse_strategy(best)
+    return {"length": N, "m": m, "max_loss": max_loss, "strategy": best,
+            "loss": strategy_loss(strategy), "seconds": timings[best],
+            "timings": timings}
+
+# ========================================
+#
+#                Wisdom
+#
+# ========================================
+wisdom_cache = {}
+
+def load_wisdom(path=DEFAULT_WISDOM):
+    """ Reads a wisdom file, or returns empty wisdom if there isn't one.
+        Only a file that exists is cached, so one written later by another
+        process is still found."""
+    if path not in wisdom_cache:
+        if not os.path.exists(path):
+            return {"machine": machine_description(), "entries": []}
+        with open(path) as source:
+            wisdom_cache[path] = json.load(source)
+    return wisdom_cache[path]
+
+def save_wisdom(wisdom, path=DEFAULT_WISDOM):
+    """ Writes the wisdom file, replacing it in one step"""
+    temporary = "{}.{}.tmp".format(path, os.getpid())
+    with open(temporary, "w") as out:
+        json.dump(wisdom, out, indent=1, sort_keys=True)
+    os.replace(temporary, path)
+    wisdom_cache[path] = wisdom
+    choice_cache.clear()
+
+def machine_description():
+    """ Where the wisdom or a benchmark was measured, since it only holds
+        there"""
+    return {"node": platform.node(), "machine": platform.machine(),
+            "processor": platform.processor(),
+            "python": platform.python_version(), "numpy": np.__version__}
+
+def tune(lengths, ms, max_loss=DEFAULT_MAX_LOSS, path=DEFAULT_WISDOM,
+         max_depth=2, limit=8, repeats=3, seed=0):
+    """ Tunes every length and m, replacing what the wisdom file had for
+        the same length, m and max_loss, and returns the new entries"""
+    wisdom = load_wisdom(path)
+    wisdom["machine"] = machine_description()
+    entries = []
+    for m in ms:
+        for N in lengths:
+            entry = tune_length(N, m, max_loss, max_depth, limit, repeats, seed)
+            print("length {} m={} max_loss={}: {} ({} bits lost, {:.5f} s)".format(
+                N, m, max_loss, entry["strategy"], entry["loss"], entry["seconds"]))
+            wisdom["entries"] = [old for old in wisdom["entries"]
+                                 if (old["length"], old["m"], old["max_loss"])
+                                 != (N, m, max_loss)]
+            wisdom["entries"].append(entry)
+            entries.append(entry)
+    save_wisdom(wisdom, path)
+    return entries
+
+# ========================================
+#
+#              Dispatching
+#
+# ========================================
+choice_cache = {}
+
+def choose_strategy(length, m, max_loss=DEFAULT_MAX_LOSS, path=DEFAULT_WISDOM):
+    """ Returns the strategy the wisdom recommends for this length and m:
+        the winner of the closest tuned length, preferring ones tuned for
+        the same m, among those losing at most max_loss bits. Without any,
+        it's schoolbook."""
+    key = (length, m, max_loss, path)
+    if key in choice_cache:
+        return choice_cache[key]
+    best = None
+    best_score = None
+    for entry in load_wisdom(path)["entries"]:
+        strategy = planner.parse_strategy(entry["strategy"])
+        if entry["loss"] > max_loss or not planner.strategy_fits(strategy, length):
+            continue
+        score = (entry["m"] != m, abs(math.log(entry["length"] / length)))
+        if best_score is None or score < best_score:
+            best, best_score = strategy, score
+    best = best if best is not None else ()
+    # like load_wisdom, nothing is cached until there's a wisdom file
+    if path in wisdom_cache:
+        choice_cache[key] = best
+    return best
+
+def multiply_auto(f, g, m, max_loss=DEFAULT_MAX_LOSS, path=DEFAULT_WISDOM):
+    """ Multiplies f and g mod 2^m exactly, with the strategy the wisdom
+        says is fastest among those losing at most max_loss bits"""
+    if len(f) != len(g):
+        raise ValueError("Can only multiply polys of the same length")
+    strategy = choose_strategy(len(f), m, max_loss, path)
+    prod = pl.multiply_strategy(f, g, strategy, m + strategy_loss(strategy))
+    return [c % 2**m for c in prod]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tune Toom-Cook strategies on this machine")
+    parser.add_argument("--length", type=int, nargs="+", default=[64, 256, 1024])
+    parser.add_argument("--m", type=int, nargs="+", default=[32])
+    parser.add_argument("--max-loss", type=int, default=DEFAULT_MAX_LOSS)
+    parser.add_argument("--max-depth", type=int, default=2)
+    parser.add_argument("--limit", type=int, default=8,
+                        help="how many of the cheapest strategies of each depth by the planner's estimate to time")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--wisdom", default=DEFAULT_WISDOM)
+    args = parser.parse_args()
+    tune(args.length, args.m, args.max_loss, args.wisdom, args.max_depth,
+         args.limit, args.repeats, args.seed)
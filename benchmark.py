@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""
+This file times the multiplication engines against each other: schoolbook,
+Toom-n with every set of formulas, Kronecker substitution, the NTT and the
+float FFT, over lengths from 8 to 65536 and several m. Inputs come from
+fixed seeds, every engine is warmed up and then timed over repeated runs,
+and the results are written as JSON with the mean, a 95% confidence
+interval and the throughput of each cell, plus the lengths where the
+fastest engine changes.
+
+With --baseline, the run is compared against an earlier result file and
+exits with an error if an engine got slower, so it can gate regressions.
+
+Example:
+    python benchmark.py --length 8 64 512 --m 32 --engine schoolbook toom4:efficient kronecker
+"""
+
+import argparse
+import json
+import math
+import statistics
+import sys
+import time
+
+import numpy as np
+
+import autotune
+import precision_loser as pl
+
+DEFAULT_LENGTHS = [2**e for e in range(3, 17)]
+DEFAULT_OUTPUT = "benchmark_results.json"
+
+# Runs shorter than this get the engine called several times per run, so
+# that the timer's resolution doesn't matter
+MIN_RUN_SECONDS = 0.02
+
+# Two-sided 95% quantiles of Student's t distribution by degrees of freedom
+T_95 = {1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447,
+        7: 2.365, 8: 2.306, 9: 2.262, 10: 2.228, 15: 2.131, 20: 2.086,
+        30: 2.042}
+
+# ========================================
+#
+#               Engines
+#
+# ========================================
+# An engine multiplies two polys of the same length mod 2^m, called as
+# engine(f, g, m).
+
+def toom_engine(n, formulas):
+    def engine(f, g, m):
+        return pl.multiply(f, g, n, m, formulas)
+    return engine
+
+def all_engines(ns=range(4, 16), formulas_list=("natural", "efficient")):
+    """ Returns the engines by name, in the order they're reported"""
+    engines = {"schoolbook": lambda f, g, m: pl.schoolbook_mod(f, g, 2**m),
+               "kronecker": lambda f, g, m: pl.kronecker_mod(f, g, 2**m),
+               "ntt": lambda f, g, m: pl.ntt_mod(f, g, 2**m),
+               "fft": lambda f, g, m: pl.fft_mod(f, g, 2**m)}
+    for n in ns:
+        for formulas in formulas_list:
+            engines["toom{}:{}".format(n, formulas)] = toom_engine(n, formulas)
+    return engines
+
+# ========================================
+#
+#               Timing
+#
+# ========================================
+def t_quantile(df):
+    """ The 95% quantile for df degrees of freedom, rounding df down to
+        the nearest one in the table"""
+    known = [d for d in T_95 if d <= df]
+    return T_95[max(known)] if known else T_95[1]
+
+def time_engine(engine, f, g, m, warmup=1, repeats=5):
+    """ Returns the seconds per call of each of repeats runs, after warmup
+        runs that aren't counted"""
+    # find how many calls make one run long enough
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            engine(f, g, m)
+        if time.perf_counter() - start >= MIN_RUN_SECONDS:
+            break
+        number *= 2
+    for _ in range(warmup):
+        for _ in range(number):
+            engine(f, g, m)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(number):
+            engine(f, g, m)
+        times.append((time.perf_counter() - start) / number)
+    return times
+
+def summarize(times):
+    """ Returns the mean, standard deviation and half-width of the 95%
+        confidence interval of the mean"""
+    mean = statistics.mean(times)
+    if len(times) < 2:
+        return mean, 0.0, 0.0
+    stdev = statistics.stdev(times)
+    return mean, stdev, t_quantile(len(times) - 1) * stdev / math.sqrt(len(times))
+
+def run_benchmark(lengths, ms, engines, warmup=1, repeats=5, seed=0,
+                  budget=1.0):
+    """ Times every engine at every length and m, and returns one result
+        per cell. Once an engine takes more than budget seconds per call,
+        the longer lengths are skipped for it (at that m)."""
+    results = []
+    for m in ms:
+        too_slow = set()
+        for length in sorted(lengths):
+            rng = np.random.default_rng([seed, length, m])
+            f = pl.random_poly(length, m, rng)
+            g = pl.random_poly(length, m, rng)
+            for name, engine in engines.items():
+                result = {"engine": name, "length": length, "m": m}
+                if name in too_slow:
+                    result["skipped"] = True
+                    results.append(result)
+                    continue
+                times = time_engine(engine, f, g, m, warmup, repeats)
+                mean, stdev, ci95 = summarize(times)
+                result.update({"mean": mean, "stdev": stdev, "ci95": ci95,
+                               "runs": len(times),
+                               "coefs_per_second": length / mean})
+                results.append(result)
+                if mean > budget:
+                    too_slow.add(name)
+                print("m={:<3} length={:<6} {:<16} {:12.6f} s +- {:.6f}".format(
+                    m, length, name, mean, ci95))
+    return results
+
+# ========================================
+#
+#             Crossovers
+#
+# ========================================
+def fastest_engines(results):
+    """ Maps each (m, length) to the name of its fastest engine"""
+    fastest = {}
+    best = {}
+    for result in results:
+        if result.get("skipped"):
+            continue
+        key = (result["m"], result["length"])
+        if key not in best or result["mean"] < best[key]:
+            best[key] = result["mean"]
+            fastest[key] = result["engine"]
+    return fastest
+
+def crossovers(results):
+    """ Returns the lengths where the fastest engine changes, for each m"""
+    fastest = fastest_engines(results)
+    points = []
+    previous = {}
+    for m, length in sorted(fastest):
+        engine = fastest[(m, length)]
+        if m in previous and previous[m] != engine:
+            points.append({"m": m, "length": length, "from": previous[m],
+                           "to": engine})
+        previous[m] = engine
+    return points
+
+# ========================================
+#
+#             Regressions
+#
+# ========================================
+def regressions(results, baseline, tolerance=0.1):
+    """ Returns the cells that are slower than in baseline by more than
+        tolerance (a fraction), beyond both confidence intervals"""
+    old = {(r["engine"], r["length"], r["m"]): r for r in baseline["results"]
+           if not r.get("skipped")}
+    slower = []
+    for result in results:
+        if result.get("skipped"):
+            continue
+        before = old.get((result["engine"], result["length"], result["m"]))
+        if before is None:
+            continue
+        limit = (before["mean"] + before["ci95"]) * (1 + tolerance)
+        if result["mean"] - result["ci95"] > limit:
+            slower.append({"engine": result["engine"], "length": result["length"],
+                           "m": result["m"], "before": before["mean"],
+                           "after": result["mean"]})
+    return slower
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time the multiplication engines and find their crossovers")
+    parser.add_argument("--length", type=int, nargs="+", default=DEFAULT_LENGTHS)
+    parser.add_argument("--m", type=int, nargs="+", default=[16, 32, 64])
+    parser.add_argument("--engine", nargs="+", default=None,
+                        help="engines to time, like schoolbook toom4:natural kronecker (all by default)")
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--budget", type=float, default=1.0,
+                        help="stop timing an engine at longer lengths once a call takes this many seconds")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", default=None,
+                        help="an earlier output to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    parser.add_argument("--threads", type=int, default=None,
+                        help="run multiply's evaluations and pointwise products on a pool of this many threads")
+    args = parser.parse_args()
+    if args.threads:
+        pl.enable_thread_pool(args.threads)
+
+    engines = all_engines()
+    if args.engine:
+        unknown = [name for name in args.engine if name not in engines]
+        if unknown:
+            parser.error("unknown engines {}".format(", ".join(unknown)))
+        engines = {name: engines[name] for name in args.engine}
+    results = run_benchmark(args.length, args.m, engines, args.warmup,
+                            args.repeats, args.seed, args.budget)
+    report = {"machine": autotune.machine_description(),
+              "config": {"lengths": args.length, "ms": args.m,
+                         "engines": list(engines), "warmup": args.warmup,
+                         "repeats": args.repeats, "seed": args.seed,
+                         "budget": args.budget, "threads": args.threads},
+              "results": results,
+              "crossovers": crossovers(results)}
+    with open(args.output, "w") as out:
+        json.dump(report, out, indent=1)
+    for point in report["crossovers"]:
+        print("m={}: {} overtakes {} at length {}".format(
+            point["m"], point["to"], point["from"], point["length"]))
+
+    if args.baseline:
+        with open(args.baseline) as source:
+            slower = regressions(results, json.load(source), args.tolerance)
+        for cell in slower:
+            print("REGRESSION {engine} length={length} m={m}: {before:.6f} s -> {after:.6f} s".format(**cell))
+        if slower:
+            sys.exit(1)
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+This file finds the exact worst-case precision loss of Toom-n for small
+moduli by trying every pair (f, g) of polynomials of a given length mod 2^m,
+instead of sampling random ones. The inputs are enumerated in chunks that go
+through multiply as CoefficientBatch lanes, and the chunks are spread over
+a pool of processes.
+
+Example:
+    python exhaustive.py --n 4 5 --m 2 3 --formulas natural efficient
+"""
+
+import argparse
+import itertools
+import multiprocessing
+
+import numpy as np
+
+import precision_loser as pl
+
+# ========================================
+#
+#             Enumeration
+#
+# ========================================
+def decode_inputs(start, size, length, m):
+    """ Input number x encodes f and g with 2*length digits base 2^m, f in
+        the low digits. Returns f and g as lists of CoefficientBatch for
+        the inputs start, ..., start+size-1."""
+    indices = np.uint64(start) + np.arange(size, dtype=np.uint64)
+    mask = np.uint64(2**m - 1)
+    digits = [pl.CoefficientBatch((indices >> np.uint64(m*j)) & mask)
+              for j in range(2*length)]
+    return digits[:length], digits[length:]
+
+def worst_case_in_chunk(args):
+    """ Returns (max loss, index of an input that attains it) over one
+        chunk of inputs"""
+    n, m, formulas, length, start, size = args
+    f, g = decode_inputs(start, size, length, m)
+    true_answer = pl.schoolbook_mod(f, g, 2**m)
+    toom_answer = pl.multiply(f, g, n, m, formulas)
+    losses = pl.bits_lost_batch(true_answer, toom_answer, m, size)
+    worst = int(np.argmax(losses))
+    return int(losses[worst]), start + worst
+
+def exhaustive_max_loss(n, m, formulas="efficient", length=None,
+                        batch_size=2**18, processes=None):
+    """ Tries every pair of polys of the given length (n by default) mod
+        2^m and returns (max bits lost, f, g) for a pair attaining it"""
+    if length is None:
+        length = n
+    total = 2**(2*m*length)
+    if total > 2**64:
+        raise ValueError("2^{} inputs is too many to enumerate".format(2*m*length))
+    chunks = [(n, m, formulas, length, start, min(batch_size, total - start))
+              for start in range(0, total, batch_size)]
+    if processes == 1 or len(chunks) == 1:
+        results = map(worst_case_in_chunk, chunks)
+        max_loss, witness = max(results, key=lambda result: result[0])
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            results = pool.imap_unordered(worst_case_in_chunk, chunks)
+            max_loss, witness = max(results, key=lambda result: result[0])
+    digits = [(witness >> (m*j)) % 2**m for j in range(2*length)]
+    return max_loss, digits[:length], digits[length:]
+
+def exhaustive_table(ns, ms, formulas_list, length=None, batch_size=2**18,
+                     processes=None):
+    """ Prints and returns the exact worst-case loss for every combination"""
+    table = {}
+    for n, formulas, m in itertools.product(ns, formulas_list, ms):
+        max_loss, f, g = exhaustive_max_loss(n, m, formulas, length,
+                                             batch_size, processes)
+        table[(n, formulas, m)] = max_loss
+        print("Toom-{} with the {} interpolation formulas mod 2^{} loses at most {} bits (e.g. f = {}, g = {}).".format(
+            n, formulas, m, max_loss, f, g))
+    return table
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Exact worst-case Toom-Cook precision loss for small moduli")
+    parser.add_argument("--n", type=int, nargs="+", default=[4])
+    parser.add_argument("--m", type=int, nargs="+", default=[2])
+    parser.add_argument("--formulas", nargs="+", default=["efficient"])
+    parser.add_argument("--length", type=int, default=None,
+                        help="polynomial length, n by default")
+    parser.add_argument("--batch-size", type=int, default=2**18)
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+    exhaustive_table(args.n, args.m, args.formulas, args.length,
+                     args.batch_size, args.processes)
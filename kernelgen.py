@@ -0,0 +1,1009 @@
+# -*- coding: utf-8 -*-
+"""
+This file writes specialized versions of multiply for fixed lengths N,
+Toom-n, formulas and moduli 2^m. The interpolation formulas are traced once
+into a graph of operations, which is written out as row kernels: they
+interpolate the (2n-1, L) uint64 buffer of products that Polys and
+MultiplyPlans build in place, for any length, using a small scratch buffer
+for the temporaries.
+
+A specialized multiply for m up to 64 splits and evaluates with fixed
+slices and constants, convolves into such a buffer and calls the row
+kernel, then adds the rows into the product at fixed offsets. For larger
+m, where the lanes don't fit, the graph is written out as straight-line
+Python instead: the evaluation points are local variables instead of dict
+keys, and each interpolated coefficient is added straight into its place
+in the product, so interpolation and recombination happen in the same
+loop.
+
+Before either is written, the graph is optimized: reductions that aren't
+needed are dropped, constants folded, common subexpressions merged and the
+nodes reordered to keep few temporaries alive. --report prints how many
+additions, shifts and multiplications each kernel does before and after.
+
+The generated modules are cached on disk, in generated_kernels/ or
+$TOOM_KERNEL_CACHE, and reused until the formulas or this file change.
+Where the cache can't be written they're built in memory instead.
+specialize registers a kernel with precision_loser, and from then on
+multiply uses it for that length. A kernel on disk isn't picked up by
+itself: each process specializes the lengths it wants, so that multiply on
+lists never has to import this file.
+
+Example:
+    python kernelgen.py --N 256 509 677 821 --n 4 --m 32 --check
+    python kernelgen.py --n 4 8 15 --formulas natural efficient --report
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import inspect
+import os
+import random
+import tempfile
+import threading
+import time
+import types
+
+import precision_loser as pl
+
+PRODUCTION_LENGTHS = (256, 509, 677, 821)
+
+# Where generated kernels are cached, unless a cache_dir is passed. Set
+# TOOM_KERNEL_CACHE to move it, e.g. when this directory is read-only.
+DEFAULT_CACHE = os.environ.get("TOOM_KERNEL_CACHE") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "generated_kernels")
+
+# ========================================
+#
+#              Tracing
+#
+# ========================================
+class KernelGraph:
+    """ The operations an interpolation kernel does on one coefficient.
+        nodes[i] is a tuple (op, args...), where the args of "add" and
+        "sub" and the first arg of "neg", "mul", "mod" and "floordiv" are
+        indices of earlier nodes, and the others are ints. inputs maps each
+        evaluation point to its node and outputs lists the nodes of the
+        2n-1 interpolated coefficients."""
+
+    def __init__(self):
+        self.nodes = []
+        self.inputs = {}
+        self.outputs = []
+
+    def add_node(self, *node):
+        self.nodes.append(node)
+        return TracedValue(self, len(self.nodes) - 1)
+
+    def uses(self):
+        """ Returns how many times each node is used, counting outputs"""
+        counts = [0]*len(self.nodes)
+        for node in self.nodes:
+            for arg in node_operands(node):
+                counts[arg] += 1
+        for index in self.outputs:
+            counts[index] += 1
+        return counts
+
+def node_operands(node):
+    """ The indices of the nodes that node uses"""
+    op = node[0]
+    if op in ("add", "sub"):
+        return node[1:]
+    if op in ("neg", "mul", "mod", "floordiv"):
+        return node[1:2]
+    return ()
+
+class TracedValue:
+    """ Stands in for a coefficient while tracing, recording every
+        operation done on it in its graph"""
+    __slots__ = ("graph", "index")
+
+    def __init__(self, graph, index):
+        self.graph = graph
+        self.index = index
+
+    def _node(self, other):
+        if isinstance(other, TracedValue):
+            return other.index
+        return self.graph.add_node("const", other).index
+
+    def __add__(self, other):
+        return self.graph.add_node("add", self.index, self._node(other))
+
+    def __radd__(self, other):
+        return self.graph.add_node("add", self._node(other), self.index)
+
+    def __sub__(self, other):
+        return self.graph.add_node("sub", self.index, self._node(other))
+
+    def __rsub__(self, other):
+        return self.graph.add_node("sub", self._node(other), self.index)
+
+    def __neg__(self):
+        return self.graph.add_node("neg", self.index)
+
+    def __mul__(self, other):
+        if isinstance(other, TracedValue):
+            raise TypeError("The interpolation formulas are linear")
+        return self.graph.add_node("mul", self.index, other)
+
+    __rmul__ = __mul__
+
+    def __mod__(self, modulus):
+        return self.graph.add_node("mod", self.index, modulus)
+
+    def __floordiv__(self, divisor):
+        return self.graph.add_node("floordiv", self.index, divisor)
+
+def trace_kernel(n, m, formulas="efficient"):
+    """ Runs the Toom-n interpolation kernel mod 2^m on one TracedValue per
+        evaluation point and returns the graph it built"""
+    graph = KernelGraph()
+    r = {}
+    for point in pl.make_eval_list(n):
+        value = graph.add_node("input", point)
+        graph.inputs[point] = value.index
+        r[point] = [value]
+    r_coefs = pl.interpolation_kernel(n, formulas)(r, 2**m)
+    for coefs in r_coefs:
+        value = coefs[0]
+        if not isinstance(value, TracedValue):
+            value = graph.add_node("const", value)
+        graph.outputs.append(value.index)
+    return graph
+
+# ========================================
+#
+#             Optimization
+#
+# ========================================
+# The traced graphs do a lot of work twice. Every step of the formulas
+# reduces mod 2^m, the same sums like r[a] + r[-a] are formed in several
+# places, and constants like inverse_mod(3, m) are multiplied in one after
+# another. Since reducing mod 2^m commutes with adding, subtracting and
+# multiplying, a reduction is only needed where its value is divided or
+# returned, and optimize drops the rest. Then it folds constants (products
+# of multipliers, multiplying by 1, adding 0, ...), merges the nodes that
+# compute the same thing, drops what no output needs and orders the nodes
+# so that fewer temporaries are alive at once. The answers are the same
+# mod 2^m, and whatever is divided or returned is still reduced.
+
+# Multipliers with at most this many bits (as the residue mod 2^m closest
+# to 0) count as small constants
+SMALL_CONSTANT_BITS = 16
+
+def live_uses(graph):
+    """ Like graph.uses, but only counting nodes that some output needs"""
+    live = set(graph.outputs)
+    for index in range(len(graph.nodes) - 1, -1, -1):
+        if index in live:
+            live.update(node_operands(graph.nodes[index]))
+    counts = [0]*len(graph.nodes)
+    for index in live:
+        for arg in node_operands(graph.nodes[index]):
+            counts[arg] += 1
+    for index in graph.outputs:
+        counts[index] += 1
+    return counts
+
+def needed_reductions(graph, modulus):
+    """ Maps each node to the node to use in its place, skipping the
+        reductions mod modulus whose value is only added, subtracted,
+        negated, multiplied or reduced again"""
+    needed = set(graph.outputs)
+    for node in graph.nodes:
+        if node[0] == "floordiv":
+            needed.add(node[1])
+    replacement = list(range(len(graph.nodes)))
+    for index, node in enumerate(graph.nodes):
+        if node[0] == "mod" and node[2] == modulus and index not in needed:
+            replacement[index] = replacement[node[1]]
+    return replacement
+
+def fold(graph, node, modulus, seen):
+    """ Adds node to graph unless it simplifies to a node graph already
+        has, and returns its index. seen maps the nodes in graph to their
+        indices. Constants are kept mod modulus."""
+    op = node[0]
+    if op == "const":
+        node = ("const", node[1] % modulus)
+    elif op != "input":
+        values = [graph.nodes[arg][1] if graph.nodes[arg][0] == "const" else None
+                  for arg in node_operands(node)]
+        a = node[1]
+        inner = graph.nodes[a]
+        if op in ("add", "sub"):
+            b = node[2]
+            if values[0] is not None and values[1] is not None:
+                total = values[0] + values[1] if op == "add" else values[0] - values[1]
+                return fold(graph, ("const", total), modulus, seen)
+            if values[1] == 0:
+                return a
+            if op == "add" and values[0] == 0:
+                return b
+            if op == "sub" and a == b:
+                return fold(graph, ("const", 0), modulus, seen)
+            if op == "sub" and values[0] == 0:
+                return fold(graph, ("neg", b), modulus, seen)
+            if op == "add":
+                node = ("add", min(a, b), max(a, b))
+        elif op == "neg":
+            if values[0] is not None:
+                return fold(graph, ("const", -values[0]), modulus, seen)
+            if inner[0] == "neg":
+                return inner[1]
+            if inner[0] == "mul":
+                return fold(graph, ("mul", inner[1], -inner[2]), modulus, seen)
+        elif op == "mul":
+            c = node[2] % modulus
+            if c == 1:
+                return a
+            if c == 0 or values[0] is not None:
+                return fold(graph, ("const", c*(values[0] or 0)), modulus, seen)
+            if inner[0] == "mul":
+                return fold(graph, ("mul", inner[1], c*inner[2]), modulus, seen)
+            if inner[0] == "neg":
+                return fold(graph, ("mul", inner[1], -c), modulus, seen)
+            node = ("mul", a, c)
+        elif op == "mod":
+            if node[2] == modulus and (values[0] is not None or inner == ("mod", inner[1], modulus)):
+                return a
+        elif op == "floordiv":
+            if node[2] == 1:
+                return a
+            # what's divided is always reduced, so a constant one is too
+            if values[0] is not None:
+                return fold(graph, ("const", values[0] // node[2]), modulus, seen)
+    if node not in seen:
+        seen[node] = graph.add_node(*node).index
+    return seen[node]
+
+def peak_temporaries(graph):
+    """ The most values alive at once while the nodes run in order,
+        counting inputs until their last use"""
+    uses = live_uses(graph)
+    alive = sum(1 for index in graph.inputs.values() if uses[index])
+    peak = alive
+    for index, node in enumerate(graph.nodes):
+        if node[0] in ("input", "const") or uses[index] == 0:
+            continue
+        for arg in node_operands(node):
+            if graph.nodes[arg][0] != "const":
+                uses[arg] -= 1
+                if uses[arg] == 0:
+                    alive -= 1
+        alive += 1
+        peak = max(peak, alive)
+    return peak
+
+def pressure_order(graph):
+    """ Orders the nodes the outputs need by list scheduling: of the nodes
+        whose operands are done, the next is the one that lets go of the
+        most values, in the traced order among equals"""
+    uses = live_uses(graph)
+    # constants go first, since they don't take a row
+    order = [index for index, node in enumerate(graph.nodes)
+             if uses[index] and node[0] == "const"]
+    users = [[] for _ in graph.nodes]
+    waiting = [0]*len(graph.nodes)
+    for index, node in enumerate(graph.nodes):
+        if uses[index] == 0:
+            continue
+        for arg in set(node_operands(node)):
+            if graph.nodes[arg][0] not in ("input", "const"):
+                users[arg].append(index)
+                waiting[index] += 1
+
+    def freed(index):
+        return sum(1 for arg in set(node_operands(graph.nodes[index]))
+                   if graph.nodes[arg][0] != "const"
+                   and uses[arg] == node_operands(graph.nodes[index]).count(arg))
+
+    ready = [index for index, node in enumerate(graph.nodes)
+             if uses[index] and node[0] not in ("input", "const")
+             and waiting[index] == 0]
+    while ready:
+        best = min(ready, key=lambda index: (-freed(index), index))
+        ready.remove(best)
+        order.append(best)
+        for arg in node_operands(graph.nodes[best]):
+            if graph.nodes[arg][0] != "const":
+                uses[arg] -= 1
+        for user in users[best]:
+            waiting[user] -= 1
+            if waiting[user] == 0:
+                ready.append(user)
+    return order
+
+def renumber(graph, order):
+    """ Returns a copy of graph with the nodes in order (after the inputs),
+        dropping the nodes that aren't in it"""
+    new = KernelGraph()
+    mapping = {}
+    for point, index in graph.inputs.items():
+        mapping[index] = new.add_node(*graph.nodes[index]).index
+        new.inputs[point] = mapping[index]
+    for index in order:
+        if index in mapping:
+            continue
+        node = graph.nodes[index]
+        if node[0] in ("add", "sub"):
+            node = (node[0], mapping[node[1]], mapping[node[2]])
+        elif node[0] != "const":
+            node = (node[0], mapping[node[1]]) + node[2:]
+        mapping[index] = new.add_node(*node).index
+    new.outputs = [mapping[index] for index in graph.outputs]
+    return new
+
+def optimize(graph, m):
+    """ Returns a graph with the same outputs mod 2^m as graph, after
+        dropping unneeded reductions, folding constants, merging common
+        subexpressions, dropping dead nodes and reordering"""
+    modulus = 2**m
+    replacement = needed_reductions(graph, modulus)
+    new = KernelGraph()
+    seen = {}
+    mapping = {}
+    for index, node in enumerate(graph.nodes):
+        if replacement[index] != index:
+            mapping[index] = mapping[replacement[index]]
+            continue
+        if node[0] in ("add", "sub"):
+            node = (node[0], mapping[node[1]], mapping[node[2]])
+        elif node[0] not in ("input", "const"):
+            node = (node[0], mapping[node[1]]) + node[2:]
+        mapping[index] = fold(new, node, modulus, seen)
+        if node[0] == "input":
+            new.inputs[node[1]] = mapping[index]
+    new.outputs = [mapping[index] for index in graph.outputs]
+
+    live = [index for index, uses in enumerate(live_uses(new)) if uses]
+    in_order = renumber(new, live)
+    reordered = renumber(new, pressure_order(new))
+    if peak_temporaries(reordered) < peak_temporaries(in_order):
+        return reordered
+    return in_order
+
+def operation_counts(graph, m):
+    """ Counts the operations per coefficient of the nodes the outputs
+        need: additions (add, sub and neg), shifts (divisions by powers of
+        2), multiplications by small and by other constants, reductions
+        mod 2^m and other divisions. Multiplying or dividing by 1 doesn't
+        count, since it does nothing."""
+    counts = dict.fromkeys(("additions", "shifts", "small_multiplications",
+                            "multiplications", "reductions", "divisions"), 0)
+    uses = live_uses(graph)
+    for index, node in enumerate(graph.nodes):
+        op = node[0]
+        if uses[index] == 0 or op in ("input", "const"):
+            continue
+        if op in ("mul", "floordiv") and node[2] % 2**m == 1:
+            continue
+        if op in ("add", "sub", "neg"):
+            counts["additions"] += 1
+        elif op == "mul":
+            c = node[2] % 2**m
+            if c > 2**(m - 1):
+                c = 2**m - c
+            if c.bit_length() <= SMALL_CONSTANT_BITS:
+                counts["small_multiplications"] += 1
+            else:
+                counts["multiplications"] += 1
+        elif op == "mod":
+            counts["reductions"] += 1
+        elif node[2] & (node[2] - 1) == 0:
+            counts["shifts"] += 1
+        else:
+            counts["divisions"] += 1
+    return counts
+
+def kernel_report(n, m, formulas="efficient"):
+    """ The operation counts of the Toom-n interpolation mod 2^m as traced
+        and as optimized, with the scratch rows of each as a row kernel"""
+    traced = trace_kernel(n, m, formulas)
+    optimized = optimize(traced, m)
+    points = pl.make_eval_list(n)
+    return {"n": n, "m": m, "formulas": formulas,
+            "traced": operation_counts(traced, m),
+            "optimized": operation_counts(optimized, m),
+            "traced_scratch_rows": row_schedule(traced, points, {})[1],
+            "optimized_scratch_rows": row_schedule(optimized, points, {})[1]}
+
+def print_report(report):
+    print("Toom-{} {} mod 2^{}:".format(report["n"], report["formulas"], report["m"]))
+    for stage in ("traced", "optimized"):
+        counts = report[stage]
+        print("  {:<9} {:>5} additions {:>5} shifts {:>5} small multiplications {:>5} multiplications {:>5} reductions  {:>3} scratch rows".format(
+            stage, counts["additions"], counts["shifts"],
+            counts["small_multiplications"], counts["multiplications"],
+            counts["reductions"], report[stage + "_scratch_rows"]))
+        if counts["divisions"]:
+            print("  {:<9} {:>5} other divisions".format("", counts["divisions"]))
+
+# ========================================
+#
+#            Code Generation
+#
+# ========================================
+def point_label(point):
+    """ A name for an evaluation point that can go in a variable name"""
+    if point == 'infinity':
+        return "inf"
+    if point < 0:
+        return "m{}".format(-point)
+    return str(point)
+
+def expression(graph, index, names):
+    """ Returns the Python expression for a node, with the nodes in names
+        referred to by name and every other node written out inline"""
+    if index in names:
+        return names[index]
+    node = graph.nodes[index]
+    op = node[0]
+    if op == "const":
+        return repr(node[1])
+    if op == "add":
+        return "({} + {})".format(expression(graph, node[1], names),
+                                  expression(graph, node[2], names))
+    if op == "sub":
+        return "({} - {})".format(expression(graph, node[1], names),
+                                  expression(graph, node[2], names))
+    if op == "neg":
+        return "(-{})".format(expression(graph, node[1], names))
+    if op == "mul":
+        return "({}*{})".format(node[2], expression(graph, node[1], names))
+    if op == "mod":
+        return "({} % {})".format(expression(graph, node[1], names), node[2])
+    if op == "floordiv":
+        return "({} // {})".format(expression(graph, node[1], names), node[2])
+    raise ValueError("Unknown operation {}".format(op))
+
+def interpolation_body(graph, indent):
+    """ Returns the lines that compute the outputs o0, o1, ... of the graph
+        from the inputs r_<point>. Nodes used more than once get their own
+        variable, the others are written inline where they're used."""
+    names = {index: "r_" + point_label(point)
+             for point, index in graph.inputs.items()}
+    uses = graph.uses()
+    lines = []
+    outputs = set(graph.outputs)
+    for index, node in enumerate(graph.nodes):
+        if index in names or node[0] == "const":
+            continue
+        if uses[index] > 1 or index in outputs:
+            lines.append("{}t{} = {}".format(indent, index, expression(graph, index, names)))
+            names[index] = "t{}".format(index)
+    for j, index in enumerate(graph.outputs):
+        lines.append("{}o{} = {}".format(indent, j, expression(graph, index, names)))
+    return lines
+
+def evaluation_terms(point, n, modulus):
+    """ Returns the sum of x0, ..., x{n-1} times the powers of point mod
+        modulus, as the source of an expression. The multiples are taken
+        between -modulus/2 and modulus/2, which doesn't change the answer
+        mod modulus."""
+    terms = []
+    coefficient = 1
+    for j in range(n):
+        c = coefficient if coefficient <= modulus // 2 else coefficient - modulus
+        if c != 0:
+            sign = "-" if c < 0 else "+"
+            term = "x{}".format(j) if abs(c) == 1 else "{}*x{}".format(abs(c), j)
+            terms.append((sign, term))
+        coefficient = (coefficient*point) % modulus
+    if not terms:
+        return "0"
+    source = ("-" if terms[0][0] == "-" else "") + terms[0][1]
+    for sign, term in terms[1:]:
+        source += " {} {}".format(sign, term)
+    return source
+
+def generate_source(N, n, m, formulas="efficient", source_hash=None):
+    """ Returns the source of a module with a function multiply(f, g) that
+        gives the same answer as precision_loser.multiply(f, g, n, m,
+        formulas) for polys of length N"""
+    if m <= 64:
+        return generate_row_multiply_source(N, n, m, formulas, source_hash)
+    return generate_list_source(N, n, m, formulas, source_hash)
+
+def generate_row_multiply_source(N, n, m, formulas="efficient", source_hash=None):
+    """ generate_source for m up to 64: the blocks are fixed slices of one
+        uint64 array, each point's evaluation is one expression in them, and
+        the products go into a (2n-1, 2k-1) buffer that the row kernel
+        interpolates in place before it's added into the product at fixed
+        offsets"""
+    k = (N + n - 1) // n
+    points = pl.make_eval_list(n)
+    rows = len(points)
+    xs = ", ".join("x{}".format(j) for j in range(n))
+
+    lines = ["# -*- coding: utf-8 -*-",
+             '"""',
+             "Generated by kernelgen.py: Toom-{} with the {} interpolation formulas".format(n, formulas),
+             "for polys of length {} mod 2^{}. Don't edit, it gets overwritten.".format(N, m),
+             '"""',
+             "",
+             "import numpy as np",
+             "",
+             "from precision_loser import row_kernel",
+             "",
+             "SOURCE_HASH = {!r}".format(source_hash),
+             "",
+             "ROWS = row_kernel({}, 2**{}, {!r})".format(n, m, formulas)]
+    if m < 64:
+        lines.append("MASK = np.uint64({})".format(2**m - 1))
+    lines += ["",
+              "def evaluate(f):",
+              '    """ Splits f into {} blocks of {} and evaluates them at the points"""'.format(n, k),
+              "    x = np.zeros({}, dtype=np.uint64)".format(n*k),
+              "    x[:{}] = [c % {} for c in f]".format(N, 2**m),
+              "    {} = {}".format(xs, ", ".join(
+                  "x[{}:{}]".format(j*k, (j + 1)*k) for j in range(n)))]
+    # the lanes wrap mod 2^64, which doesn't change the answer mod 2^m
+    evaluations = []
+    for point in points:
+        if point == 'infinity':
+            evaluations.append("x{}".format(n - 1))
+        elif point == 0:
+            evaluations.append("x0")
+        else:
+            evaluations.append(evaluation_terms(point, n, 2**m))
+    lines.append("    return [{}]".format(",\n            ".join(evaluations)))
+    lines.append("")
+
+    lines.append("def multiply(f, g):")
+    lines.append('    """ Multiplies f and g of length {} mod 2^{}"""'.format(N, m))
+    lines.append("    f_eval = evaluate(f)")
+    lines.append("    g_eval = evaluate(g)")
+    lines.append("    R = np.empty(({}, {}), dtype=np.uint64)".format(rows, 2*k - 1))
+    for i in range(rows):
+        lines.append("    R[{0}] = np.convolve(f_eval[{0}], g_eval[{0}])".format(i))
+    if m < 64:
+        lines.append("    R &= MASK")
+    lines.append("    ROWS.solve_rows(R)")
+    lines.append("    prod = np.zeros({}, dtype=np.uint64)".format(2*n*k - 1))
+    for j in range(rows):
+        lines.append("    prod[{}:{}] += R[{}]".format(j*k, j*k + 2*k - 1, j))
+    if m < 64:
+        lines.append("    prod &= MASK")
+    if 2*n*k - 1 == 2*N - 1:
+        lines.append("    return prod.tolist()")
+    else:
+        lines.append("    return prod[:{}].tolist()".format(2*N - 1))
+    return "\n".join(lines) + "\n"
+
+def generate_list_source(N, n, m, formulas="efficient", source_hash=None):
+    """ generate_source for any m, in plain Python on lists: the
+        interpolation is written out once per coefficient and each result
+        is added straight into its place in the product"""
+    modulus = 2**m
+    k = (N + n - 1) // n
+    pad = n*k - N
+    points = pl.make_eval_list(n)
+    labels = [point_label(point) for point in points]
+    graph = optimize(trace_kernel(n, m, formulas), m)
+    xs = ", ".join("x{}".format(j) for j in range(n))
+    blocks = ", ".join("f{}".format(j) for j in range(n))
+
+    lines = ["# -*- coding: utf-8 -*-",
+             '"""',
+             "Generated by kernelgen.py: Toom-{} with the {} interpolation formulas".format(n, formulas),
+             "for polys of length {} mod 2^{}. Don't edit, it gets overwritten.".format(N, m),
+             '"""',
+             "",
+             "from precision_loser import schoolbook_mod",
+             "",
+             "SOURCE_HASH = {!r}".format(source_hash),
+             "",
+             "def evaluate(f):",
+             '    """ Splits f into {} blocks of {} and evaluates them at the points"""'.format(n, k)]
+    if pad:
+        lines.append("    f = list(f) + [0]*{}".format(pad))
+    lines.append("    {} = {}".format(blocks, ", ".join(
+        "f[{}:{}]".format(j*k, (j + 1)*k) for j in range(n))))
+    evaluations = []
+    for point, label in zip(points, labels):
+        if point == 'infinity':
+            evaluations.append("f{}".format(n - 1))
+        elif point == 0:
+            evaluations.append("[x % {} for x in f0]".format(modulus))
+        else:
+            evaluations.append("[({}) % {} for {} in zip({})]".format(
+                evaluation_terms(point, n, modulus), modulus, xs, blocks))
+    lines.append("    return [{}]".format(",\n            ".join(evaluations)))
+    lines.append("")
+
+    lines.append("def multiply(f, g):")
+    lines.append('    """ Multiplies f and g of length {} mod 2^{}"""'.format(N, m))
+    lines.append("    f_eval = evaluate(f)")
+    lines.append("    g_eval = evaluate(g)")
+    for i, label in enumerate(labels):
+        lines.append("    p_{} = schoolbook_mod(f_eval[{}], g_eval[{}], {})".format(label, i, i, modulus))
+    lines.append("    prod = [0]*{}".format(2*n*k - 1))
+    inputs = ", ".join("r_" + label for label in labels)
+    body = interpolation_body(graph, " "*8)
+
+    # the first k coefficients of each interpolated poly land where nothing
+    # has been written yet
+    lines.append("    for i, ({}) in enumerate(zip({})):".format(
+        inputs, ", ".join("p_{}[:{}]".format(label, k) for label in labels)))
+    lines.extend(body)
+    for j in range(2*n - 1):
+        lines.append("        prod[i + {}] = o{}".format(j*k, j))
+
+    # the rest overlap the first k of the next one, except for the last
+    if k > 1:
+        lines.append("    for i, ({}) in enumerate(zip({}), {}):".format(
+            inputs, ", ".join("p_{}[{}:]".format(label, k) for label in labels), k))
+        lines.extend(body)
+        for j in range(2*n - 2):
+            lines.append("        prod[i + {0}] = (prod[i + {0}] + o{1}) % {2}".format(j*k, j, modulus))
+        lines.append("        prod[i + {}] = o{}".format((2*n - 2)*k, 2*n - 2))
+    if 2*n*k - 1 == 2*N - 1:
+        lines.append("    return prod")
+    else:
+        lines.append("    return prod[:{}]".format(2*N - 1))
+    return "\n".join(lines) + "\n"
+
+# ========================================
+#
+#             Row Kernels
+#
+# ========================================
+# A row kernel does the interpolation on the rows of a (2n-1, L) uint64
+# buffer R, row i holding the products at make_eval_list(n)[i], so every
+# operation of the graph is one numpy operation on a whole row. The lanes
+# wrap mod 2^64 like CoefficientBatch: reducing mod 2^m is a mask, and
+# since the formulas only divide values they just reduced, by powers of
+# 2, dividing is a shift.
+#
+# Nothing is allocated: every operation writes its row through the out
+# argument of a ufunc, either into a row of R whose value is no longer
+# needed or into a row of a scratch workspace W. Rows are handed out like registers, a row coming
+# free as soon as the last node using its value is done, and each output
+# goes straight into its own row of R when that's free, so R ends up
+# holding the interpolated polys. W needs only as many rows as the most
+# temporaries ever alive at once beyond those that fit in R.
+
+def row_constant(value, constants):
+    """ The name of the module level uint64 constant for value mod 2^64,
+        adding it to constants if it's new"""
+    value %= 2**64
+    if value not in constants:
+        constants[value] = "K{}".format(len(constants))
+    return constants[value]
+
+def row_alias(node):
+    """ Whether node leaves its operand unchanged on uint64 lanes, so it
+        can share the operand's row"""
+    op = node[0]
+    return ((op == "mul" and node[2] % 2**64 == 1)
+            or (op == "mod" and node[2] == 2**64)
+            or (op == "floordiv" and node[2] == 1))
+
+def row_operation(node, operands, out, constants):
+    """ The line that computes node into the row out, given its node
+        operands' rows (or constant names)"""
+    op = node[0]
+    if op in ("add", "sub"):
+        return "np.{}({}, {}, {})".format("add" if op == "add" else "subtract",
+                                              operands[0], operands[1], out)
+    if op == "neg":
+        return "np.negative({}, {})".format(operands[0], out)
+    if op == "mul":
+        return "np.multiply({}, {}, {})".format(
+            operands[0], row_constant(node[2], constants), out)
+    if op == "mod":
+        modulus = node[2]
+        if modulus & (modulus - 1) or modulus > 2**64:
+            raise ValueError("Rows only work mod powers of 2 up to 2^64, not {}".format(modulus))
+        return "np.bitwise_and({}, {}, {})".format(
+            operands[0], row_constant(modulus - 1, constants), out)
+    if op == "floordiv":
+        divisor = node[2]
+        if divisor & (divisor - 1) == 0:
+            return "np.right_shift({}, {}, {})".format(
+                operands[0], row_constant(divisor.bit_length() - 1, constants), out)
+        return "np.floor_divide({}, {}, {})".format(
+            operands[0], row_constant(divisor, constants), out)
+    raise ValueError("Unknown operation {}".format(op))
+
+def row_schedule(graph, points, constants):
+    """ Returns the lines of a row kernel for graph, with the inputs in the
+        rows r0, r1, ... of R in the order of points, and the number of
+        rows w0, w1, ... of W it uses"""
+    uses = live_uses(graph)
+    location = {}
+    holders = {}
+    free = []
+    lines = []
+    scratch = [0]
+
+    def release(index):
+        uses[index] -= 1
+        if uses[index] == 0:
+            row = location[index]
+            holders[row] -= 1
+            if holders[row] == 0:
+                free.append(row)
+                return row
+        return None
+
+    def new_row(preferred=(), scratch_only=False):
+        for row in preferred:
+            if row in free:
+                free.remove(row)
+                return row
+        # scratch rows first, to leave the rows of R for the outputs
+        for row in reversed(free):
+            if row.startswith("w"):
+                free.remove(row)
+                return row
+        if free and not scratch_only:
+            return free.pop()
+        scratch[0] += 1
+        return "w{}".format(scratch[0] - 1)
+
+    for i, point in enumerate(points):
+        index = graph.inputs[point]
+        location[index] = "r{}".format(i)
+        holders[location[index]] = 1
+        if uses[index] == 0:
+            uses[index] = 1
+            release(index)
+    destinations = {}
+    for j, index in enumerate(graph.outputs):
+        destinations.setdefault(index, "r{}".format(j))
+
+    for index, node in enumerate(graph.nodes):
+        if node[0] in ("input", "const") or uses[index] == 0:
+            continue
+        args = node_operands(node)
+        if row_alias(node):
+            location[index] = location[args[0]]
+            holders[location[index]] += 1
+            release(args[0])
+            continue
+        operands = [row_constant(graph.nodes[arg][1], constants)
+                    if graph.nodes[arg][0] == "const" else location[arg]
+                    for arg in args]
+        freed = [release(arg) for arg in args if graph.nodes[arg][0] != "const"]
+        # an output into its own row, otherwise in place over an operand
+        preferred = [destinations[index]] if index in destinations else []
+        preferred += [row for row in freed if row is not None]
+        out = new_row(preferred)
+        location[index] = out
+        holders[out] = 1
+        lines.append(row_operation(node, operands, out, constants))
+
+    # move the outputs that aren't in their rows yet, without overwriting
+    # a row that still has to be moved
+    moves = {}
+    fills = []
+    for j, index in enumerate(graph.outputs):
+        if graph.nodes[index][0] == "const":
+            fills.append("r{}[...] = {}".format(j, row_constant(graph.nodes[index][1], constants)))
+        elif location[index] != "r{}".format(j):
+            moves["r{}".format(j)] = location[index]
+    while moves:
+        ready = [row for row in moves if row not in moves.values()]
+        if not ready:
+            # a cycle: park one of its rows in scratch, since every free
+            # row of R is still waiting for its output
+            row = next(iter(moves))
+            spare = new_row(scratch_only=True)
+            lines.append("np.copyto({}, {})".format(spare, row))
+            moves = {dst: spare if src == row else src for dst, src in moves.items()}
+            continue
+        for row in ready:
+            lines.append("np.copyto({}, {})".format(row, moves.pop(row)))
+    lines.extend(fills)
+    return lines, scratch[0]
+
+def generate_row_source(n, m, formulas="efficient", source_hash=None):
+    """ Returns the source of a module with a function solve_rows(R, W)
+        that interpolates the (2n-1, L) uint64 buffer R in place: row i
+        holds the products at make_eval_list(n)[i] on the way in, and the
+        interpolated poly i mod 2^m on the way out. W is a scratch buffer
+        of SCRATCH_ROWS rows of length L, allocated if it's None."""
+    points = pl.make_eval_list(n)
+    graph = optimize(trace_kernel(n, m, formulas), m)
+    constants = {}
+    body, scratch = row_schedule(graph, points, constants)
+
+    lines = ["# -*- coding: utf-8 -*-",
+             '"""',
+             "Generated by kernelgen.py: the Toom-{} interpolation with the {} formulas".format(n, formulas),
+             "mod 2^{} on the rows of a buffer. Don't edit, it gets overwritten.".format(m),
+             '"""',
+             "",
+             "import numpy as np",
+             "",
+             "SOURCE_HASH = {!r}".format(source_hash),
+             "SCRATCH_ROWS = {}".format(scratch),
+             ""]
+    lines.extend("{} = np.uint64({})".format(name, value)
+                 for value, name in constants.items())
+    lines.append("")
+    lines.append("def solve_rows(R, W=None):")
+    lines.append('    """ Interpolates the rows of R in place, at the points {}"""'.format(
+        ", ".join(str(point) for point in points)))
+    lines.append("    if W is None:")
+    lines.append("        W = np.empty((SCRATCH_ROWS, R.shape[1]), dtype=np.uint64)")
+    # the rows are looked up once, and out is passed without a keyword,
+    # since on short rows the calls cost as much as the arithmetic
+    lines.append("    {} = R".format(", ".join("r{}".format(i) for i in range(len(points)))))
+    lines.extend("    w{0} = W[{0}]".format(i) for i in range(scratch))
+    lines.extend("    " + line for line in body)
+    lines.append("    return R")
+    return "\n".join(lines) + "\n"
+
+# ========================================
+#
+#             Kernel Cache
+#
+# ========================================
+def source_hash(n, formulas):
+    """ A short hash of the formulas and of this file, so that cached
+        kernels are regenerated when either changes"""
+    kernel = pl.interpolation_kernel(n, formulas)
+    source = (inspect.getsource(inspect.getmodule(kernel))
+              + inspect.getsource(inspect.getmodule(source_hash)))
+    return hashlib.sha1(source.encode("utf-8")).hexdigest()[:12]
+
+def kernel_name(N, n, m, formulas):
+    return "toom{}_{}_N{}_m{}".format(n, formulas, N, m)
+
+def row_kernel_name(n, m, formulas):
+    return "rows_toom{}_{}_m{}".format(n, formulas, m)
+
+# one lock per kernel name, so threads that need the same kernel at once
+# generate it once instead of writing over each other
+cache_locks = {}
+cache_locks_lock = threading.Lock()
+
+def cache_lock(name):
+    with cache_locks_lock:
+        return cache_locks.setdefault(name, threading.Lock())
+
+def cached_module(name, expected, generate, cache_dir=None):
+    """ Imports the generated module name from cache_dir (DEFAULT_CACHE if
+        it's None), first writing the source generate(expected) there
+        unless the cached one has SOURCE_HASH expected. If cache_dir can't
+        be written, the module is built in memory instead."""
+    if cache_dir is None:
+        cache_dir = DEFAULT_CACHE
+    path = os.path.join(cache_dir, name + ".py")
+    with cache_lock(name):
+        if os.path.exists(path):
+            module = import_file(name, path)
+            if getattr(module, "SOURCE_HASH", None) == expected:
+                return module
+        source = generate(expected)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # a temporary file of its own, then renamed, so another process
+            # never imports a half-written kernel
+            handle, temporary = tempfile.mkstemp(suffix=".tmp", dir=cache_dir)
+        except OSError:
+            return import_source(name, source)
+        try:
+            with os.fdopen(handle, "w") as out:
+                out.write(source)
+            os.replace(temporary, path)
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+        return import_file(name, path)
+
+def load_kernel(N, n, m, formulas="efficient", cache_dir=None):
+    """ Returns the specialized multiply(f, g) for these parameters,
+        generating it first unless an up to date one is cached"""
+    def generate(expected):
+        return generate_source(N, n, m, formulas, expected)
+    return cached_module(kernel_name(N, n, m, formulas),
+                         source_hash(n, formulas), generate, cache_dir).multiply
+
+def load_row_kernel(n, m, formulas="efficient", cache_dir=None):
+    """ Returns the module with solve_rows(R, W) and SCRATCH_ROWS for
+        Toom-n mod 2^m, generating it first unless an up to date one is
+        cached"""
+    def generate(expected):
+        return generate_row_source(n, m, formulas, expected)
+    return cached_module(row_kernel_name(n, m, formulas),
+                         source_hash(n, formulas), generate, cache_dir)
+
+def import_file(name, path):
+    spec = importlib.util.spec_from_file_location("generated_" + name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def import_source(name, source):
+    module = types.ModuleType("generated_" + name)
+    exec(compile(source, "<generated {}>".format(name), "exec"), module.__dict__)
+    return module
+
+def specialize(N, n, m, formulas="efficient", cache_dir=None):
+    """ Loads (or generates) the kernel for these parameters and registers
+        it, so multiply(f, g, n, m, formulas) uses it for length N"""
+    kernel = load_kernel(N, n, m, formulas, cache_dir)
+    pl.register_specialized_kernel(N, n, m, formulas, kernel)
+    return kernel
+
+def specialize_production(ns=(4,), ms=(32,), formulas_list=("efficient",),
+                          lengths=PRODUCTION_LENGTHS, cache_dir=None):
+    """ Specializes multiply for every combination, by default Toom-4 mod
+        2^32 at the production lengths"""
+    for N in lengths:
+        for n in ns:
+            for m in ms:
+                for formulas in formulas_list:
+                    specialize(N, n, m, formulas, cache_dir)
+
+# ========================================
+#
+#               Checking
+#
+# ========================================
+def check_kernel(N, n, m, formulas="efficient", trials=3, cache_dir=None):
+    """ Compares the specialized kernel with the general multiply on random
+        inputs and returns (general seconds, specialized seconds) per call"""
+    kernel = load_kernel(N, n, m, formulas, cache_dir)
+    # multiply mustn't use the kernel while it's the reference, but a
+    # kernel that specialize registered stays registered afterwards
+    key = (N, n, m, formulas)
+    registered = pl.specialized_kernels.pop(key, None)
+    general_time = 0.0
+    special_time = 0.0
+    try:
+        for _ in range(trials):
+            f = [random.randrange(2**m) for _ in range(N)]
+            g = [random.randrange(2**m) for _ in range(N)]
+            start = time.perf_counter()
+            expected = pl.multiply(f, g, n, m, formulas)
+            general_time += time.perf_counter() - start
+            start = time.perf_counter()
+            answer = kernel(f, g)
+            special_time += time.perf_counter() - start
+            if answer != expected:
+                raise AssertionError("The kernel for {} disagrees with multiply".format(
+                    kernel_name(N, n, m, formulas)))
+    finally:
+        if registered is not None:
+            pl.specialized_kernels[key] = registered
+    return general_time / trials, special_time / trials
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate specialized Toom-Cook kernels for fixed lengths")
+    parser.add_argument("--N", type=int, nargs="+", default=list(PRODUCTION_LENGTHS))
+    parser.add_argument("--n", type=int, nargs="+", default=[4])
+    parser.add_argument("--m", type=int, nargs="+", default=[32])
+    parser.add_argument("--formulas", nargs="+", default=["efficient"])
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE)
+    parser.add_argument("--check", action="store_true",
+                        help="compare each kernel with multiply and time both")
+    parser.add_argument("--report", action="store_true",
+                        help="print the operation counts of the interpolation formulas instead")
+    args = parser.parse_args()
+    if args.report:
+        for n in args.n:
+            for m in args.m:
+                for formulas in args.formulas:
+                    print_report(kernel_report(n, m, formulas))
+    else:
+        for N in args.N:
+            for n in args.n:
+                for m in args.m:
+                    for formulas in args.formulas:
+                        load_kernel(N, n, m, formulas, args.cache_dir)
+                        if args.check:
+                            general, special = check_kernel(N, n, m, formulas,
+                                                            cache_dir=args.cache_dir)
+                            print("{}: multiply {:.4f} s, specialized {:.4f} s ({:.2f}x)".format(
+                                kernel_name(N, n, m, formulas), general, special, general / special))
+                        else:
+                            print("Wrote {}".format(kernel_name(N, n, m, formulas)))
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+This file plans multiplication strategies for a target modulus 2^q. A
+strategy is a list of levels applied recursively, like Toom-4 followed by
+two levels of Karatsuba, with schoolbook at the bottom. Since each level
+gets its inputs mod 2^m and gives an answer that's right mod 2^(m - loss),
+the losses of the levels add up, and the strategy needs a working width of
+q plus that sum to be right mod 2^q.
+
+Strategies are written as levels joined by '+', for example
+    toom4:natural+karatsuba+karatsuba
+
+Example:
+    python planner.py --q 13 --N 256 --lane 16
+"""
+
+import argparse
+import itertools
+import json
+import os
+
+import precision_loser as pl
+
+LANES = (16, 32, 64)
+
+# ========================================
+#
+#              Strategies
+#
+# ========================================
+def parse_strategy(text):
+    """ Turns 'toom4:natural+karatsuba' into
+        (("toom", 4, "natural"), ("karatsuba",)), and 'schoolbook' into ()"""
+    if text == "schoolbook":
+        return ()
+    levels = []
+    for part in text.split("+"):
+        if part == "karatsuba":
+            levels.append(("karatsuba",))
+        elif part.startswith("toom"):
+            n, _, formulas = part[4:].partition(":")
+            levels.append(("toom", int(n), formulas or "efficient"))
+        else:
+            raise ValueError("Unknown level {}".format(part))
+    return tuple(levels)
+
+def format_strategy(strategy):
+    """ The inverse of parse_strategy"""
+    if not strategy:
+        return "schoolbook"
+    return "+".join("karatsuba" if level[0] == "karatsuba"
+                    else "toom{}:{}".format(level[1], level[2])
+                    for level in strategy)
+
+def level_loss(level, measured=None):
+    """ Bits lost by one level. Toom-n loses precision_loss_bound, or the
+        measured loss if there is a bigger one: random trials only show
+        how much can be lost at least, so they never lower the bound the
+        width has to guarantee. Karatsuba evaluates at 0, 1 and infinity,
+        so its interpolation only subtracts and loses nothing."""
+    if level[0] == "karatsuba":
+        return 0
+    _, n, formulas = level
+    bound = pl.precision_loss_bound(n, formulas)
+    if measured is not None and (n, formulas) in measured:
+        return max(measured[(n, formulas)], bound)
+    return bound
+
+def level_split(level):
+    """ Returns (number of pieces, number of sub-products) of a level"""
+    if level[0] == "karatsuba":
+        return (2, 3)
+    n = level[1]
+    return (n, 2*n - 1)
+
+def strategy_cost(strategy, N):
+    """ Estimates the number of coefficient operations to multiply polys of
+        length N: the multiply-adds of the schoolbook products at the
+        bottom, plus the evaluation, interpolation and recombination of
+        every level, which are linear in the length"""
+    if not strategy:
+        return N*N
+    pieces, products = level_split(strategy[0])
+    k = (N + pieces - 1) // pieces
+    if strategy[0][0] == "karatsuba":
+        # f0 + f1 and g0 + g1, then two subtractions per coefficient
+        evaluation = 2*k
+        interpolation = 2 * (2*k - 1)
+    else:
+        evaluation = 2 * products * pieces * k
+        interpolation = products * products * (2*k - 1)
+    recombination = 2 * (2*N - 1)
+    return (products * strategy_cost(strategy[1:], k)
+            + evaluation + interpolation + recombination)
+
+def strategy_fits(strategy, N):
+    """ A level only makes sense if each piece has at least one
+        coefficient"""
+    for level in strategy:
+        pieces = level_split(level)[0]
+        if N < pieces:
+            return False
+        N = (N + pieces - 1) // pieces
+    return True
+
+# ========================================
+#
+#               Planning
+#
+# ========================================
+def plan_strategy(strategy, q, N, measured=None):
+    """ Returns the plan for one strategy: per-level losses, total loss,
+        minimal working width, the smallest lane that holds it and the
+        estimated cost"""
+    losses = [level_loss(level, measured) for level in strategy]
+    width = q + sum(losses)
+    lanes = [lane for lane in LANES if width <= lane]
+    return {"strategy": format_strategy(strategy),
+            "level_losses": losses,
+            "total_loss": sum(losses),
+            "width": width,
+            "lane": lanes[0] if lanes else None,
+            "cost": strategy_cost(strategy, N)}
+
+def candidate_strategies(N, max_depth=3, ns=range(4, 16),
+                         formulas_list=("natural", "efficient")):
+    """ Every strategy of up to max_depth levels of Toom-n and Karatsuba
+        that fits length N"""
+    menu = [("toom", n, formulas) for n in ns for formulas in formulas_list]
+    menu.append(("karatsuba",))
+    strategies = [()]
+    for depth in range(1, max_depth + 1):
+        for strategy in itertools.product(menu, repeat=depth):
+            if strategy_fits(strategy, N):
+                strategies.append(strategy)
+    return strategies
+
+def plan(q, N, strategies=None, measured=None, max_depth=3):
+    """ Plans every strategy (all candidates by default) and returns them
+        sorted by estimated cost"""
+    if strategies is None:
+        strategies = candidate_strategies(N, max_depth)
+    plans = [plan_strategy(strategy, q, N, measured) for strategy in strategies]
+    return sorted(plans, key=lambda p: (p["cost"], p["width"]))
+
+def recommend(q, N, lane=None, measured=None, max_depth=3):
+    """ Returns the plan of the fastest strategy whose working width fits
+        in lane bits (or in any of LANES)"""
+    limit = max(LANES) if lane is None else lane
+    for candidate in plan(q, N, measured=measured, max_depth=max_depth):
+        if candidate["width"] <= limit:
+            return candidate
+    return None
+
+def measured_losses_from_store(path):
+    """ Reads the worst loss seen for each (n, formulas) in a sweep.py
+        result store, over the full products. A cell that lost all m bits
+        only shows the loss is at least m, so it's skipped."""
+    measured = {}
+    if not os.path.exists(path):
+        return measured
+    with open(path) as store:
+        for line in store:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get("mode", "full") != "full":
+                continue
+            if record["max_loss"] >= record["m"]:
+                continue
+            key = (record["n"], record["formulas"])
+            measured[key] = max(measured.get(key, 0), record["max_loss"])
+    return measured
+
+def print_plan(p):
+    print("{:<40} losses {:<12} total {:>2}  width {:>2}  lane {:>4}  cost {}".format(
+        p["strategy"], str(p["level_losses"]), p["total_loss"], p["width"],
+        p["lane"] if p["lane"] is not None else "none", p["cost"]))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Plan Toom-Cook strategies for a target modulus 2^q")
+    parser.add_argument("--q", type=int, required=True)
+    parser.add_argument("--N", type=int, required=True, help="polynomial length")
+    parser.add_argument("--lane", type=int, default=None, choices=LANES)
+    parser.add_argument("--strategy", nargs="+", default=None,
+                        help="only plan these strategies, like toom4:natural+karatsuba")
+    parser.add_argument("--store", default=None,
+                        help="also use the losses measured by a sweep.py store where they exceed the static bounds")
+    parser.add_argument("--max-depth", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+    measured = measured_losses_from_store(args.store) if args.store else None
+    if args.strategy:
+        for text in args.strategy:
+            print_plan(plan_strategy(parse_strategy(text), args.q, args.N, measured))
+    else:
+        for p in plan(args.q, args.N, measured=measured, max_depth=args.max_depth)[:args.top]:
+            print_plan(p)
+        best = recommend(args.q, args.N, args.lane, measured, args.max_depth)
+        if best is None:
+            print("No strategy fits.")
+        else:
+            print("Recommended:")
+            print_plan(best)
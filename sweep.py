@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+This file runs parameter sweeps of the precision loss experiments over grids
+of n, m, formulas, lengths and trial counts. Results are stored in a JSONL
+file keyed by the configuration, the seed and a hash of the formulas, so a
+rerun skips finished cells and resumes interrupted ones from their last
+checkpoint.
+
+Example:
+    python sweep.py --n 4 5 6 --m 16 32 --formulas natural efficient
+"""
+
+import argparse
+import hashlib
+import inspect
+import itertools
+import json
+import os
+
+import numpy as np
+
+import precision_loser as pl
+
+DEFAULT_STORE = "sweep_results.jsonl"
+
+# ========================================
+#
+#             Result Store
+#
+# ========================================
+def formulas_version(n, formulas):
+    """ Returns a short hash of the code that the results of Toom-n with
+        these formulas depend on: the kernel module and all of
+        precision_loser, which has the splitting, evaluation, recombination
+        and the references. Changing either changes the hash, so old
+        results are not reused."""
+    kernel = pl.interpolation_kernel(n, formulas)
+    source = (inspect.getsource(inspect.getmodule(kernel))
+              + inspect.getsource(pl))
+    return hashlib.sha1(source.encode("utf-8")).hexdigest()[:12]
+
+def cell_key(n, m, formulas, length, num_trials, seed, version, screen=False,
+             mode="full"):
+    """ Returns the string that identifies one cell of a sweep"""
+    return "n={} m={} formulas={} mode={} length={} trials={} seed={} screen={} version={}".format(
+        n, m, formulas, mode, length, num_trials, seed, screen, version)
+
+def load_store(path):
+    """ Reads the store at path and returns a dict mapping each cell key
+        to the latest record written for it"""
+    records = {}
+    if not os.path.exists(path):
+        return records
+    with open(path) as store:
+        for line in store:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # a half-written line from an interrupted run
+                continue
+            records[record["key"]] = record
+    return records
+
+def append_record(path, record):
+    """ Appends a record to the store and flushes it to disk"""
+    torn = False
+    if os.path.exists(path) and os.path.getsize(path) > 0:
+        with open(path, "rb") as store:
+            store.seek(-1, os.SEEK_END)
+            torn = store.read(1) != b"\n"
+    with open(path, "a") as store:
+        if torn:
+            # don't glue this record onto a half-written line
+            store.write("\n")
+        store.write(json.dumps(record, sort_keys=True) + "\n")
+        store.flush()
+        os.fsync(store.fileno())
+
+# ========================================
+#
+#               Sweeping
+#
+# ========================================
+def trial_rng(seed, n, m, trial):
+    """ Every trial gets its own generator, so a cell can be resumed at
+        any trial and still see the same inputs"""
+    return np.random.default_rng([seed, n, m, trial])
+
+def run_cell(n, m, formulas, length, num_trials, seed, store_path, records,
+             checkpoint_every=100, screen=False, mode="full"):
+    """ Runs (or resumes) one cell of the sweep and returns its record.
+        length=None means a random length in [2n, 10n) for each trial.
+        screen=True estimates each trial first and only runs the full
+        reference when the estimate beats the loss so far. mode is one of
+        precision_loser.PRODUCT_MODES."""
+    if screen and mode != "full":
+        raise ValueError("Screening only works for full products")
+    version = formulas_version(n, formulas)
+    key = cell_key(n, m, formulas, length, num_trials, seed, version, screen,
+                   mode)
+    record = records.get(key)
+    if record is not None and record["trials_done"] >= num_trials:
+        return record
+
+    trials_done = record["trials_done"] if record is not None else 0
+    max_loss = record["max_loss"] if record is not None else 0
+    record = {"key": key, "n": n, "m": m, "formulas": formulas, "mode": mode,
+              "length": length, "num_trials": num_trials, "seed": seed,
+              "screen": screen, "version": version, "trials_done": trials_done,
+              "max_loss": max_loss}
+    for trial in range(trials_done, num_trials):
+        rng = trial_rng(seed, n, m, trial)
+        if length is None:
+            degree = int(rng.integers(2*n, 10*n))
+        else:
+            degree = length
+        f = pl.random_poly(degree, m, rng)
+        g = pl.random_poly(degree, m, rng)
+        if screen:
+            loss = pl.screened_trial(f, g, n, m, formulas, max_loss, rng)
+        else:
+            loss = pl.precision_lost_single_trial(f, g, n, m, formulas,
+                                                  mode=mode)
+        if loss > max_loss:
+            max_loss = loss
+        trials_done = trial + 1
+        if trials_done % checkpoint_every == 0 or trials_done == num_trials:
+            record = dict(record, trials_done=trials_done, max_loss=max_loss)
+            append_record(store_path, record)
+            records[key] = record
+    return record
+
+def sweep(ns, ms, formulas_list, lengths, trial_counts, seed=0,
+          store_path=DEFAULT_STORE, checkpoint_every=100, screen=False,
+          modes=("full",)):
+    """ Runs every cell of the grid, skipping the ones already in the
+        store, and returns the list of records"""
+    if screen and any(mode != "full" for mode in modes):
+        raise ValueError("Screening only works for full products")
+    records = load_store(store_path)
+    results = []
+    for n, m, formulas, mode, length, num_trials in itertools.product(
+            ns, ms, formulas_list, modes, lengths, trial_counts):
+        cached = records.get(cell_key(n, m, formulas, length, num_trials, seed,
+                                      formulas_version(n, formulas), screen,
+                                      mode))
+        record = run_cell(n, m, formulas, length, num_trials, seed,
+                          store_path, records, checkpoint_every, screen, mode)
+        status = ""
+        if cached is not None and cached["trials_done"] >= num_trials:
+            status = " (cached)"
+        elif cached is not None:
+            status = " (resumed at trial {})".format(cached["trials_done"])
+        print("Toom-{} {} {} m={} length={} trials={}: {} bits lost{}".format(
+            n, formulas, mode, m, "random" if length is None else length,
+            num_trials, record["max_loss"], status))
+        results.append(record)
+    return results
+
+def print_profile(summary):
+    """ Prints the time multiply spent in each stage over the sweep"""
+    total = sum(stage["seconds"] for stage in summary["stages"].values())
+    print("Profiled {} multiply calls, {:.3f} s in total".format(summary["calls"], total))
+    for name, stage in summary["stages"].items():
+        share = stage["seconds"] / total if total else 0.0
+        print("  {:<12} {:10.3f} s  {:6.1%}".format(name, stage["seconds"], share))
+
+def parse_length(text):
+    """ Lengths on the command line are ints or 'random'"""
+    return None if text == "random" else int(text)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sweep the Toom-Cook precision loss experiments")
+    parser.add_argument("--n", type=int, nargs="+", default=[4])
+    parser.add_argument("--m", type=int, nargs="+", default=[32])
+    parser.add_argument("--formulas", nargs="+", default=["efficient"])
+    parser.add_argument("--mode", nargs="+", default=["full"],
+                        choices=pl.PRODUCT_MODES)
+    parser.add_argument("--length", type=parse_length, nargs="+", default=[None],
+                        help="polynomial lengths, or 'random' for [2n, 10n)")
+    parser.add_argument("--trials", type=int, nargs="+", default=[100])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--store", default=DEFAULT_STORE)
+    parser.add_argument("--checkpoint-every", type=int, default=100)
+    parser.add_argument("--screen", action="store_true",
+                        help="estimate each trial first and only run the schoolbook reference on suspicious ones")
+    parser.add_argument("--profile", action="store_true",
+                        help="print the time multiply spent in each stage")
+    args = parser.parse_args()
+    if args.screen and any(mode != "full" for mode in args.mode):
+        parser.error("--screen only works with --mode full")
+    if args.profile:
+        pl.enable_profiling(keep_records=False)
+    sweep(args.n, args.m, args.formulas, args.length, args.trials, args.seed,
+          args.store, args.checkpoint_every, args.screen, args.mode)
+    if args.profile:
+        print_profile(pl.disable_profiling().summary())
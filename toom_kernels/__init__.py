@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""
+The interpolation formulas, one module per (formulas, n), named like
+efficient_4. Each module has a function solve(r, m) that does the work of
+precision_loser.solve_for_coefficients_mod for that case. They're imported
+on first use by precision_loser.interpolation_kernel.
+"""
@@ -0,0 +1,817 @@
+# -*- coding: utf-8 -*-
+"""
+The Toom-15 interpolation formulas (natural), split out of precision_loser.py
+so they're only compiled when Toom-15 is used.
+"""
+
+from precision_loser import inverse_mod, split_powers_of_two
+
+def solve(r, m):
+    """ Solves for the 2n-1 coefficients of the product from the products
+        r at the evaluation points, mod m"""
+    r0 = r[0]
+
+    r28 = r['infinity']
+
+    L = len(r0)
+
+    r26 = [(9657700*(r[1][i] + r[-1][i])
+     - 7726160*(r[2][i] + r[-2][i])
+     + 5311735*(r[3][i] + r[-3][i])
+     - 3124550*(r[4][i] + r[-4][i])
+     + 1562275*(r[5][i] + r[-5][i])
+     - 657800*(r[6][i] + r[-6][i])
+     + 230230*(r[7][i] + r[-7][i])
+     - 65780*(r[8][i] + r[-8][i])
+     + 14950*(r[9][i] + r[-9][i])
+     - 2600*(r[10][i] + r[-10][i])
+     + 325*(r[11][i] + r[-11][i])
+     - 26*(r[12][i] + r[-12][i])
+     + (r[13][i] + r[-13][i])
+     - 10400600*r0[i]
+     - 330295706662690015543296000000*r28[i]
+    ) % m  for i in range(L)]
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(403291461126605635584000000)
+        denom_inv = inverse_mod(odd_part, m)
+        r26[i] = (r26[i] * denom_inv) % m
+        r26[i] = r26[i] // even_part
+
+    r24 = [(-2496144*(r[1][i] + r[-1][i])
+     + 1961256*(r[2][i] + r[-2][i])
+     - 1307504*(r[3][i] + r[-3][i])
+     + 735471*(r[4][i] + r[-4][i])
+     - 346104*(r[5][i] + r[-5][i])
+     + 134596*(r[6][i] + r[-6][i])
+     - 42504*(r[7][i] + r[-7][i])
+     + 10626*(r[8][i] + r[-8][i])
+     - 2024*(r[9][i] + r[-9][i])
+     + 276*(r[10][i] + r[-10][i])
+     - 24*(r[11][i] + r[-11][i])
+     + (r[12][i] + r[-12][i])
+     + 2704156*r0[i]
+     - 403291461126605635584000000*r26[i]
+     - 149903436100759314746572800000*r28[i]
+    ) % m  for i in range(L)]
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(620448401733239439360000)
+        denom_inv = inverse_mod(odd_part, m)
+        r24[i] = (r24[i] * denom_inv) % m
+        r24[i] = r24[i] // even_part
+
+    r22 = [(646646*(r[1][i] + r[-1][i])
+     - 497420*(r[2][i] + r[-2][i])
+     + 319770*(r[3][i] + r[-3][i])
+     - 170544*(r[4][i] + r[-4][i])
+     + 74613*(r[5][i] + r[-5][i])
+     - 26334*(r[6][i] + r[-6][i])
+     + 7315*(r[7][i] + r[-7][i])
+     - 1540*(r[8][i] + r[-8][i])
+     + 231*(r[9][i] + r[-9][i])
+     - 22*(r[10][i] + r[-10][i])
+     + (r[11][i] + r[-11][i])
+     - 705432*r0[i]
+     - 568744368255469486080000*r24[i]
+     - 166357727714724824678400000*r26[i]
+     - 37042320704478727628390400000*r28[i]
+    ) % m  for i in range(L)]
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(1124000727777607680000)
+        denom_inv = inverse_mod(odd_part, m)
+        r22[i] = (r22[i] * denom_inv) % m
+        r22[i] = r22[i] // even_part
+
+    r20 = [(-167960*(r[1][i] + r[-1][i])
+     + 125970*(r[2][i] + r[-2][i])
+     - 77520*(r[3][i] + r[-3][i])
+     + 38760*(r[4][i] + r[-4][i])
+     - 15504*(r[5][i] + r[-5][i])
+     + 4845*(r[6][i] + r[-6][i])
+     - 1140*(r[7][i] + r[-7][i])
+     + 190*(r[8][i] + r[-8][i])
+     - 20*(r[9][i] + r[-9][i])
+     + (r[10][i] + r[-10][i])
+     + 184756*r0[i]
+     - 936667273148006400000*r22[i]
+     - 211124803367560642560000*r24[i]
+     - 36608302274885332992000000*r26[i]
+     - 5425950533240873322086400000*r28[i]
+    ) % m  for i in range(L)]
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(2432902008176640000)
+        denom_inv = inverse_mod(odd_part, m)
+        r20[i] = (r20[i] * denom_inv) % m
+        r20[i] = r20[i] // even_part
+
+    r18 = [(43758*(r[1][i] + r[-1][i])
+     - 31824*(r[2][i] + r[-2][i])
+     + 18564*(r[3][i] + r[-3][i])
+     - 8568*(r[4][i] + r[-4][i])
+     + 3060*(r[5][i] + r[-5][i])
+     - 816*(r[6][i] + r[-6][i])
+     + 153*(r[7][i] + r[-7][i])
+     - 18*(r[8][i] + r[-8][i])
+     + (r[9][i] + r[-9][i])
+     - 48620*r0[i]
+     - 1824676506132480000*r20[i]
+     - 309100200138842112000*r22[i]
+     - 40778478784550707200000*r24[i]
+     - 4645053436190368481280000*r26[i]
+     - 481314610282065419059200000*r28[i]
+    ) % m  for i in range(L)]
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(6402373705728000)
+        denom_inv = inverse_mod(odd_part, m)
+        r18[i] = (r18[i] * denom_inv) % m
+        r18[i] = r18[i] // even_part
+
+    r16 = [(-11440*(r[1][i] + r[-1][i])
+     + 8008*(r[2][i] + r[-2][i])
+     - 4368*(r[3][i] + r[-3][i])
+     + 1820*(r[4][i] + r[-4][i])
+     - 560*(r[5][i] + r[-5][i])
+     + 120*(r[6][i] + r[-6][i])
+     - 16*(r[7][i] + r[-7][i])
+     + (r[8][i] + r[-8][i])
+     + 12870*r0[i]
+     - 4268249137152000*r18[i]
+     - 527128768438272000*r20[i]
+     - 51442361350668288000*r22[i]
+     - 4385609982489415680000*r24[i]
+     - 343350594609952849920000*r26[i]
+     - 25398422028160175554560000*r28[i]
+    ) % m  for i in range(L)]
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(20922789888000)
+        denom_inv = inverse_mod(odd_part, m)
+        r16[i] = (r16[i] * denom_inv) % m
+        r16[i] = r16[i] // even_part
+
+    r14 = [(3003*(r[1][i] + r[-1][i])
+     - 2002*(r[2][i] + r[-2][i])
+     + 1001*(r[3][i] + r[-3][i])
+     - 364*(r[4][i] + r[-4][i])
+     + 91*(r[5][i] + r[-5][i])
+     - 14*(r[6][i] + r[-6][i])
+     + (r[7][i] + r[-7][i])
+     - 3432*r0[i]
+     - 12204960768000*r16[i]
+     - 1058170098585600*r18[i]
+     - 73775500710912000*r20[i]
+     - 4555411900194355200*r22[i]
+     - 261131482210959360000*r24[i]
+     - 14266599888013304832000*r26[i]
+     - 754754307297469839360000*r28[i]
+    ) % m  for i in range(L)]
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(87178291200)
+        denom_inv = inverse_mod(odd_part, m)
+        r14[i] = (r14[i] * denom_inv) % m
+        r14[i] = r14[i] // even_part
+
+    r12 = [(-792*(r[1][i] + r[-1][i])
+     + 495*(r[2][i] + r[-2][i])
+     - 220*(r[3][i] + r[-3][i])
+     + 66*(r[4][i] + r[-4][i])
+     - 12*(r[5][i] + r[-5][i])
+     + (r[6][i] + r[-6][i])
+     + 924*r0[i]
+     - 43589145600*r14[i]
+     - 2528170444800*r16[i]
+     - 120467944396800*r18[i]
+     - 5167100908569600*r20[i]
+     - 208331313744153600*r22[i]
+     - 8083281646573056000*r24[i]
+     - 305994026290208256000*r26[i]
+     - 11397316294188849024000*r28[i]
+    ) % m  for i in range(L)]
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(479001600)
+        denom_inv = inverse_mod(odd_part, m)
+        r12[i] = (r12[i] * denom_inv) % m
+        r12[i] = r12[i] // even_part
+
+    r10 = [(210*(r[1][i] + r[-1][i])
+     - 120*(r[2][i] + r[-2][i])
+     + 45*(r[3][i] + r[-3][i])
+     - 10*(r[4][i] + r[-4][i])
+     + (r[5][i] + r[-5][i])
+     - 252*r0[i]
+     - 199584000*r12[i]
+     - 7264857600*r14[i]
+     - 223134912000*r16[i]
+     - 6289809926400*r18[i]
+     - 169058189664000*r20[i]
+     - 4419351149875200*r22[i]
+     - 113605204648320000*r24[i]
+     - 2890388998040544000*r26[i]
+     - 73066712935376160000*r28[i]
+    ) % m  for i in range(L)]
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(3628800)
+        denom_inv = inverse_mod(odd_part, m)
+        r10[i] = (r10[i] * denom_inv) % m
+        r10[i] = r10[i] // even_part
+
+    r8 = [(-56*(r[1][i] + r[-1][i])
+     + 28*(r[2][i] + r[-2][i])
+     - 8*(r[3][i] + r[-3][i])
+     + (r[4][i] + r[-4][i])
+     + 70*r0[i]
+     - 1209600*r10[i]
+     - 25280640*r12[i]
+     - 461260800*r14[i]
+     - 7904856960*r16[i]
+     - 131254905600*r18[i]
+     - 2143293425280*r20[i]
+     - 34682510016000*r22[i]
+     - 558432020361600*r24[i]
+     - 8966533159584000*r26[i]
+     - 143749174428961920*r28[i]
+    ) % m  for i in range(L)]
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(40320)
+        denom_inv = inverse_mod(odd_part, m)
+        r8[i] = (r8[i] * denom_inv) % m
+        r8[i] = r8[i] // even_part
+
+    r6 = [(15*(r[1][i] + r[-1][i])
+     - 6*(r[2][i] + r[-2][i])
+     + (r[3][i] + r[-3][i])
+     - 20*r0[i]
+     - 10080*r8[i]
+     - 105840*r10[i]
+     - 1013760*r12[i]
+     - 9369360*r14[i]
+     - 85307040*r16[i]
+     - 771695280*r18[i]
+     - 6960985920*r20[i]
+     - 62711787600*r22[i]
+     - 564657746400*r24[i]
+     - 5082926350320*r26[i]
+     - 45750363684480*r28[i]
+    ) % m  for i in range(L)]
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(720)
+        denom_inv = inverse_mod(odd_part, m)
+        r6[i] = (r6[i] * denom_inv) % m
+        r6[i] = r6[i] // even_part
+
+    r4 = [(-4*(r[1][i] + r[-1][i])
+     + (r[2][i] + r[-2][i])
+     + 6*r0[i]
+     - 120*r6[i]
+     - 504*r8[i]
+     - 2040*r10[i]
+     - 8184*r12[i]
+     - 32760*r14[i]
+     - 131064*r16[i]
+     - 524280*r18[i]
+     - 2097144*r20[i]
+     - 8388600*r22[i]
+     - 33554424*r24[i]
+     - 134217720*r26[i]
+     - 536870904*r28[i]
+    ) % m  for i in range(L)]
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(24)
+        denom_inv = inverse_mod(odd_part, m)
+        r4[i] = (r4[i] * denom_inv) % m
+        r4[i] = r4[i] // even_part
+
+    r2 = [((r[1][i] + r[-1][i])
+     - 2*r0[i]
+     - 2*r4[i]
+     - 2*r6[i]
+     - 2*r8[i]
+     - 2*r10[i]
+     - 2*r12[i]
+     - 2*r14[i]
+     - 2*r16[i]
+     - 2*r18[i]
+     - 2*r20[i]
+     - 2*r22[i]
+     - 2*r24[i]
+     - 2*r26[i]
+     - 2*r28[i]
+    ) % m  for i in range(L)]
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(2)
+        denom_inv = inverse_mod(odd_part, m)
+        r2[i] = (r2[i] * denom_inv) % m
+        r2[i] = r2[i] // even_part
+
+    r27 = [(-2674440*r[1][i] 
+     + 4345965*r[2][i]
+     - 4601610*r[3][i]
+     + 3749460*r[4][i]
+     - 2466750*r[5][i]
+     + 1332045*r[6][i]
+     - 592020*r[7][i]
+     + 215280*r[8][i]
+     - 63180*r[9][i]
+     + 14625*r[10][i]
+     - 2574*r[11][i]
+     + 324*r[12][i]
+     - 26*r[13][i]
+     + r[14][i]
+     + 742900*r0[i]
+     - 416024*r2[i]
+     + 994840*r4[i]
+     - 5454824*r6[i]
+     + 55944280*r8[i]
+     - 966290024*r10[i]
+     + 26454613720*r12[i]
+     - 1109329691624*r14[i]
+     + 70212852387160*r16[i]
+     - 6733670404619624*r18[i]
+     + 1005318113348848600*r20[i]
+     - 249581050854994274024*r22[i]
+     + 120719220687299365182040*r24[i]
+     - 202039976682357297272094824*r26[i]
+     - 385557844336439370252173428520*r28[i]
+    ) % m for i in range(L)]
+
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(10888869450418352160768000000)
+        denom_inv = inverse_mod(odd_part, m)
+        r27[i] = (r27[i] * denom_inv) % m
+        r27[i] = r27[i] // even_part
+
+    r25 = [(742900*r[1][i] 
+     - 1188640*r[2][i]
+     + 1225785*r[3][i]
+     - 961400*r[4][i]
+     + 600875*r[5][i]
+     - 303600*r[6][i]
+     + 123970*r[7][i]
+     - 40480*r[8][i]
+     + 10350*r[9][i]
+     - 2000*r[10][i]
+     + 275*r[11][i]
+     - 24*r[12][i]
+     + r[13][i]
+     - 208012*r0[i]
+     + 117572*r2[i]
+     - 285532*r4[i]
+     + 1602692*r6[i]
+     - 16996252*r8[i]
+     + 307475012*r10[i]
+     - 8966430172*r12[i]
+     + 409745686532*r14[i]
+     - 29195711499292*r16[i]
+     + 3312133208909252*r18[i]
+     - 636215671041835612*r20[i]
+     + 241648300078174135172*r22[i]
+     - 321511316149669476991132*r24[i]
+     - 492817676505266866078123708*r26[i]
+     - 12703681025488077520896000000*r27[i]
+     - 286779648275654636997381637852*r28[i]
+    ) % m for i in range(L)]
+
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(15511210043330985984000000)
+        denom_inv = inverse_mod(odd_part, m)
+        r25[i] = (r25[i] * denom_inv) % m
+        r25[i] = r25[i] // even_part
+
+    r23 = [(-208012*r[1][i] 
+     + 326876*r[2][i]
+     - 326876*r[3][i]
+     + 245157*r[4][i]
+     - 144210*r[5][i]
+     + 67298*r[6][i]
+     - 24794*r[7][i]
+     + 7084*r[8][i]
+     - 1518*r[9][i]
+     + 230*r[10][i]
+     - 22*r[11][i]
+     + r[12][i]
+     + 58786*r0[i]
+     - 33592*r2[i]
+     + 83096*r4[i]
+     - 479752*r6[i]
+     + 5299736*r8[i]
+     - 101549512*r10[i]
+     + 3208453976*r12[i]
+     - 164071220872*r14[i]
+     + 13743680753816*r16[i]
+     - 1993276972245832*r18[i]
+     + 581947914140407256*r20[i]
+     - 603916464771468176392*r22[i]
+     - 730803773459954540777704*r24[i]
+     - 16803810880275234816000000*r25[i]
+     - 339155768243774227716964552*r26[i]
+     - 6245976504198304781107200000*r27[i]
+     - 107413822788261782335458993064*r28[i]
+    ) % m for i in range(L)]
+
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(25852016738884976640000)
+        denom_inv = inverse_mod(odd_part, m)
+        r23[i] = (r23[i] * denom_inv) % m
+        r23[i] = r23[i] // even_part
+
+    r21 = [(58786*r[1][i] 
+     - 90440*r[2][i]
+     + 87210*r[3][i]
+     - 62016*r[4][i]
+     + 33915*r[5][i]
+     - 14364*r[6][i]
+     + 4655*r[7][i]
+     - 1120*r[8][i]
+     + 189*r[9][i]
+     - 20*r[10][i]
+     + r[11][i]
+     - 16796*r0[i]
+     + 9724*r2[i]
+     - 24596*r4[i]
+     + 147004*r6[i]
+     - 1708916*r8[i]
+     + 35240284*r10[i]
+     - 1237329236*r12[i]
+     + 73853629564*r14[i]
+     - 7850527669556*r16[i]
+     + 1717351379730844*r18[i]
+     - 1359124435588313876*r20[i]
+     - 1272410676942417239876*r22[i]
+     - 25852016738884976640000*r23[i]
+     - 462292539259962003646196*r24[i]
+     - 7561714896123855667200000*r25[i]
+     - 115761644587269354830466596*r26[i]
+     - 1683741850203578528563200000*r27[i]
+     - 23512975860299444963550050516*r28[i]
+    ) % m for i in range(L)]
+
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(51090942171709440000)
+        denom_inv = inverse_mod(odd_part, m)
+        r21[i] = (r21[i] * denom_inv) % m
+        r21[i] = r21[i] // even_part
+
+    r19 = [(-16796*r[1][i] 
+     + 25194*r[2][i]
+     - 23256*r[3][i]
+     + 15504*r[4][i]
+     - 7752*r[5][i]
+     + 2907*r[6][i]
+     - 798*r[7][i]
+     + 152*r[8][i]
+     - 18*r[9][i]
+     + r[10][i]
+     + 4862*r0[i]
+     - 2860*r2[i]
+     + 7436*r4[i]
+     - 46420*r6[i]
+     + 576236*r8[i]
+     - 13098580*r10[i]
+     + 532310636*r12[i]
+     - 39968611540*r14[i]
+     + 6350631494636*r16[i]
+     - 3730771315561300*r18[i]
+     - 2637991952943407764*r20[i]
+     - 46833363657400320000*r21[i]
+     - 734121065118879803860*r22[i]
+     - 10556240168378032128000*r23[i]
+     - 142438684135271315212564*r24[i]
+     - 1830415113744266649600000*r25[i]
+     - 22632897298190126259675220*r26[i]
+     - 271297526662043666104320000*r27[i]
+     - 3170344993810020486920015764*r28[i]
+    ) % m for i in range(L)]
+
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(121645100408832000)
+        denom_inv = inverse_mod(odd_part, m)
+        r19[i] = (r19[i] * denom_inv) % m
+        r19[i] = r19[i] // even_part
+
+    r17 = [(4862*r[1][i] 
+     - 7072*r[2][i]
+     + 6188*r[3][i]
+     - 3808*r[4][i]
+     + 1700*r[5][i]
+     - 544*r[6][i]
+     + 119*r[7][i]
+     - 16*r[8][i]
+     + r[9][i]
+     - 1430*r0[i]
+     + 858*r2[i]
+     - 2310*r4[i]
+     + 15258*r6[i]
+     - 206790*r8[i]
+     + 5386458*r10[i]
+     - 272513670*r12[i]
+     + 30255826458*r14[i]
+     - 12765597850950*r16[i]
+     - 6622557957272742*r18[i]
+     - 101370917007360000*r19[i]
+     - 1375210145685786630*r20[i]
+     - 17172233341046784000*r21[i]
+     - 201832098313986359142*r22[i]
+     - 2265471043586150400000*r23[i]
+     - 24529324224160803328710*r24[i]
+     - 258058524232798248960000*r25[i]
+     - 2652208374242713043720742*r26[i]
+     - 26739700571225856614400000*r27[i]
+     - 265323404171486113659725190*r28[i]
+    ) % m for i in range(L)]
+
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(355687428096000)
+        denom_inv = inverse_mod(odd_part, m)
+        r17[i] = (r17[i] * denom_inv) % m
+        r17[i] = r17[i] // even_part
+
+    r15 = [(-1430*r[1][i] 
+     + 2002*r[2][i]
+     - 1638*r[3][i]
+     + 910*r[4][i]
+     - 350*r[5][i]
+     + 90*r[6][i]
+     - 14*r[7][i]
+     + r[8][i]
+     + 429*r0[i]
+     - 264*r2[i]
+     + 744*r4[i]
+     - 5304*r6[i]
+     + 81384*r8[i]
+     - 2605944*r10[i]
+     + 192387624*r12[i]
+     - 55942352184*r14[i]
+     - 20546119600536*r16[i]
+     - 266765571072000*r17[i]
+     - 3083760849804024*r18[i]
+     - 32945548027392000*r19[i]
+     - 332500281299403096*r20[i]
+     - 3215147584416768000*r21[i]
+     - 30076927429146721464*r22[i]
+     - 274100623905588480000*r23[i]
+     - 2446077617962088140056*r24[i]
+     - 21459412163122053120000*r25[i]
+     - 185641639183185136464504*r26[i]
+     - 1587401376760010972160000*r27[i]
+     - 13442713420403849918131416*r28[i]
+    ) % m for i in range(L)]
+
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(1307674368000)
+        denom_inv = inverse_mod(odd_part, m)
+        r15[i] = (r15[i] * denom_inv) % m
+        r15[i] = r15[i] // even_part
+
+    r13 = [(429*r[1][i] 
+     - 572*r[2][i]
+     + 429*r[3][i]
+     - 208*r[4][i]
+     + 65*r[5][i]
+     - 12*r[6][i]
+     + r[7][i]
+     - 132*r0[i]
+     + 84*r2[i]
+     - 252*r4[i]
+     + 2004*r6[i]
+     - 37212*r8[i]
+     + 1710324*r10[i]
+     - 325024572*r12[i]
+     - 80789566956*r14[i]
+     - 871782912000*r15[i]
+     - 8422900930332*r16[i]
+     - 75583578470400*r17[i]
+     - 643521842437836*r18[i]
+     - 5269678622208000*r19[i]
+     - 41890044885642492*r20[i]
+     - 325386564299596800*r21[i]
+     - 2481686964269990316*r22[i]
+     - 18652248729354240000*r23[i]
+     - 138536531588626169052*r24[i]
+     - 1019042849143807488000*r25[i]
+     - 7436421488952386592396*r26[i]
+     - 53911021949819274240000*r27[i]
+     - 388701690499592948238012*r28[i]
+    ) % m for i in range(L)]
+
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(6227020800)
+        denom_inv = inverse_mod(odd_part, m)
+        r13[i] = (r13[i] * denom_inv) % m
+        r13[i] = r13[i] // even_part
+
+    r11 = [(-132*r[1][i] 
+     + 165*r[2][i]
+     - 110*r[3][i]
+     + 44*r[4][i]
+     - 10*r[5][i]
+     + r[6][i]
+     + 42*r0[i]
+     - 28*r2[i]
+     + 92*r4[i]
+     - 868*r6[i]
+     + 22652*r8[i]
+     - 2620708*r10[i]
+     - 415790788*r12[i]
+     - 3632428800*r13[i]
+     - 28616744548*r14[i]
+     - 210680870400*r15[i]
+     - 1479485236228*r16[i]
+     - 10038995366400*r17[i]
+     - 66394067988388*r18[i]
+     - 430591742380800*r19[i]
+     - 2750479262009668*r20[i]
+     - 17360942812012800*r21[i]
+     - 108550450893568228*r22[i]
+     - 673606803881088000*r23[i]
+     - 4154688725062207108*r24[i]
+     - 25499502190850688000*r25[i]
+     - 155878445775166700068*r26[i]
+     - 949776357849070752000*r27[i]
+     - 5771581202353414724548*r28[i]
+    ) % m for i in range(L)]
+
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(39916800)
+        denom_inv = inverse_mod(odd_part, m)
+        r11[i] = (r11[i] * denom_inv) % m
+        r11[i] = r11[i] // even_part
+
+    r9 = [(42*r[1][i] 
+     - 48*r[2][i]
+     + 27*r[3][i]
+     - 8*r[4][i]
+     + r[5][i]
+     - 14*r0[i]
+     + 10*r2[i]
+     - 38*r4[i]
+     + 490*r6[i]
+     - 31238*r8[i]
+     - 2922230*r10[i]
+     - 19958400*r11[i]
+     - 124075238*r12[i]
+     - 726485760*r13[i]
+     - 4084385750*r14[i]
+     - 22313491200*r15[i]
+     - 119387268038*r16[i]
+     - 628980992640*r17[i]
+     - 3275389222070*r18[i]
+     - 16905818966400*r19[i]
+     - 86665431465638*r20[i]
+     - 441935114987520*r21[i]
+     - 2244295389943190*r22[i]
+     - 11360520464832000*r23[i]
+     - 57360469753884038*r24[i]
+     - 289038899804054400*r25[i]
+     - 1454155949521941110*r26[i]
+     - 7306671293537616000*r27[i]
+     - 36677059892827099238*r28[i]
+    ) % m for i in range(L)]
+
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(362880)
+        denom_inv = inverse_mod(odd_part, m)
+        r9[i] = (r9[i] * denom_inv) % m
+        r9[i] = r9[i] // even_part
+
+    r7 = [(-14*r[1][i] 
+     + 14*r[2][i]
+     - 6*r[3][i]
+     + r[4][i]
+     + 5*r0[i]
+     - 4*r2[i]
+     + 20*r4[i]
+     - 604*r6[i]
+     - 29740*r8[i]
+     - 151200*r9[i]
+     - 708604*r10[i]
+     - 3160080*r11[i]
+     - 13645900*r12[i]
+     - 57657600*r13[i]
+     - 239967004*r14[i]
+     - 988107120*r15[i]
+     - 4037604460*r16[i]
+     - 16406863200*r17[i]
+     - 66398623804*r18[i]
+     - 267911678160*r19[i]
+     - 1078605601420*r20[i]
+     - 4335313752000*r21[i]
+     - 17403958407004*r22[i]
+     - 69804002545200*r23[i]
+     - 279780634372780*r24[i]
+     - 1120816644948000*r25[i]
+     - 4488349371924604*r26[i]
+     - 17968646803620240*r27[i]
+     - 71920337041294540*r28[i]
+    ) % m for i in range(L)]
+
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(5040)
+        denom_inv = inverse_mod(odd_part, m)
+        r7[i] = (r7[i] * denom_inv) % m
+        r7[i] = r7[i] // even_part
+
+    r5 = [(5*r[1][i] 
+     - 4*r[2][i]
+     + r[3][i]
+     - 2*r0[i]
+     + 2*r2[i]
+     - 22*r4[i]
+     - 478*r6[i]
+     - 1680*r7[i]
+     - 5542*r8[i]
+     - 17640*r9[i]
+     - 54958*r10[i]
+     - 168960*r11[i]
+     - 515062*r12[i]
+     - 1561560*r13[i]
+     - 4717438*r14[i]
+     - 14217840*r15[i]
+     - 42784582*r16[i]
+     - 128615880*r17[i]
+     - 386371918*r18[i]
+     - 1160164320*r19[i]
+     - 3482590102*r20[i]
+     - 10451964600*r21[i]
+     - 31364282398*r22[i]
+     - 94109624400*r23[i]
+     - 282362427622*r24[i]
+     - 847154391720*r25[i]
+     - 2541597392878*r26[i]
+     - 7625060614080*r27[i]
+     - 22875718713142*r28[i]
+    ) % m for i in range(L)]
+
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(120)
+        denom_inv = inverse_mod(odd_part, m)
+        r5[i] = (r5[i] * denom_inv) % m
+        r5[i] = r5[i] // even_part
+
+    r3 = [(-2*r[1][i] 
+     + r[2][i]
+     + 1*r0[i]
+     - 2*r2[i]
+     - 14*r4[i]
+     - 30*r5[i]
+     - 62*r6[i]
+     - 126*r7[i]
+     - 254*r8[i]
+     - 510*r9[i]
+     - 1022*r10[i]
+     - 2046*r11[i]
+     - 4094*r12[i]
+     - 8190*r13[i]
+     - 16382*r14[i]
+     - 32766*r15[i]
+     - 65534*r16[i]
+     - 131070*r17[i]
+     - 262142*r18[i]
+     - 524286*r19[i]
+     - 1048574*r20[i]
+     - 2097150*r21[i]
+     - 4194302*r22[i]
+     - 8388606*r23[i]
+     - 16777214*r24[i]
+     - 33554430*r25[i]
+     - 67108862*r26[i]
+     - 134217726*r27[i]
+     - 268435454*r28[i]
+    ) % m for i in range(L)]
+
+    for i in range(L):
+        odd_part,even_part = split_powers_of_two(6)
+        denom_inv = inverse_mod(odd_part, m)
+        r3[i] = (r3[i] * denom_inv) % m
+        r3[i] = r3[i] // even_part
+
+    r1 = [(r[1][i]
+     - r0[i]
+    - r2[i]
+    - r3[i]
+    - r4[i]
+    - r5[i]
+    - r6[i]
+    - r7[i]
+    - r8[i]
+    - r9[i]
+    - r10[i]
+    - r11[i]
+    - r12[i]
+    - r13[i]
+    - r14[i]
+    - r15[i]
+    - r16[i]
+    - r17[i]
+    - r18[i]
+    - r19[i]
+    - r20[i]
+    - r21[i]
+    - r22[i]
+    - r23[i]
+    - r24[i]
+    - r25[i]
+    - r26[i]
+    - r27[i]
+    - r28[i]
+    ) % m for i in range(L)]
+
+
+    return (r0, r1, r2, r3, r4, r5, r6, r7, r8, r9, r10, r11, r12, r13, r14, r15, r16, r17, r18, r19, r20, r21, r22, r23, r24, r25, r26, r27, r28)